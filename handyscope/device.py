@@ -1,8 +1,12 @@
-import ctypes
 from datetime import date
 
 from handyscope.deviceList import device_list
-from handyscope.library import libtiepie, CallbackObject
+from handyscope.library import (
+    libtiepie,
+    CallbackObject,
+    get_string,
+    version_to_str,
+)
 from handyscope.triggerInput import TriggerInput
 from handyscope.triggerOutput import TriggerOutput
 
@@ -171,19 +175,7 @@ class Device:
         Returns:
             str: long device name (e.g. "Handyscope HS5-530XMS")
         """
-        # get length of device name string
-        str_len = libtiepie.DevGetName(self._dev_handle, None, 0)
-
-        # initialize mutable string buffer
-        str_buffer = ctypes.create_string_buffer(str_len)
-
-        # write the actual device name to the buffer
-        libtiepie.DevGetName(self._dev_handle, str_buffer, str_len)
-
-        # convert to a normal python string
-        dev_name = str_buffer.value.decode("utf-8")
-
-        return dev_name
+        return get_string(libtiepie.DevGetName, self._dev_handle)
 
     @property
     def name(self):
@@ -192,19 +184,7 @@ class Device:
         Returns:
             str: device name (e.g. "HS5-530XMS")
         """
-        # get length of device name string
-        str_len = libtiepie.DevGetNameShort(self._dev_handle, None, 0)
-
-        # initialize mutable string buffer
-        str_buffer = ctypes.create_string_buffer(str_len)
-
-        # write the actual device name to the buffer
-        libtiepie.DevGetNameShort(self._dev_handle, str_buffer, str_len)
-
-        # convert to a normal python string
-        dev_name = str_buffer.value.decode("utf-8")
-
-        return dev_name
+        return get_string(libtiepie.DevGetNameShort, self._dev_handle)
 
     @property
     def vendor_id(self):
@@ -244,19 +224,7 @@ class Device:
         Returns:
             str: calibration token of the device.
         """
-        # get length of calibration token string
-        str_len = libtiepie.DevGetCalibrationToken(self._dev_handle, None, 0)
-
-        # initialize mutable string buffer
-        str_buffer = ctypes.create_string_buffer(str_len)
-
-        # write the actual calibration token to the buffer
-        libtiepie.DevGetNameShortest(self._dev_handle, str_buffer, str_len)
-
-        # convert to a normal python string
-        token = str_buffer.value.decode("utf-8")
-
-        return token
+        return get_string(libtiepie.DevGetCalibrationToken, self._dev_handle)
 
     @property
     def is_battery_available(self):
@@ -340,19 +308,7 @@ class Device:
         Returns:
             str: short device name (e.g. "HS5")
         """
-        # get length of device name string
-        str_len = libtiepie.DevGetNameShortest(self._dev_handle, None, 0)
-
-        # initialize mutable string buffer
-        str_buffer = ctypes.create_string_buffer(str_len)
-
-        # write the actual device name to the buffer
-        libtiepie.DevGetNameShortest(self._dev_handle, str_buffer, str_len)
-
-        # convert to a normal python string
-        dev_name = str_buffer.value.decode("utf-8")
-
-        return dev_name
+        return get_string(libtiepie.DevGetNameShortest, self._dev_handle)
 
     @property
     def is_removed(self):
@@ -436,18 +392,3 @@ class Device:
         """
         id_int = TriggerOutput.TRIGGER_IDS[trig_out_id]
         return libtiepie.DevTrGetOutputIndexById(self._dev_handle, id_int)
-
-
-def version_to_str(raw_version):
-    """Convert a raw version int in TiePie's format to a nice string.
-
-    Args:
-        raw_version (int): concatenated version numbers as int in
-                           TiePie's format.
-
-    Returns:
-        str: version number as str
-    """
-    return ".".join(
-        [str((raw_version >> (idx * 16)) & 0xFFFF) for idx in range(3, -1, -1)]
-    )
@@ -1,4 +1,4 @@
-from handyscope.library import libtiepie
+from handyscope.library import libtiepie, get_string, version_to_str
 
 from datetime import date
 import ctypes
@@ -36,10 +36,15 @@ class DeviceList:
                     "Gen": 2,
                     "I2C": 4}
 
-    def __init__(self):
-        """Constructor for class DeviceList."""
-        # Fill the device list
-        libtiepie.LstUpdate()
+    def __init__(self, update=True):
+        """Constructor for class DeviceList.
+
+        Args:
+            update (bool): Whether to fill the device list. The list is filled
+                           anyway when the library is initialized.
+        """
+        if update:
+            libtiepie.LstUpdate()
 
     @property
     def device_cnt(self):
@@ -290,19 +295,7 @@ class DeviceList:
         # translate id kind str to int
         id_kind_int = self.ID_KINDS[id_kind]
 
-        # get length of device name string
-        str_len = libtiepie.LstDevGetName(id_kind_int, instr_id, None, 0)
-
-        # initialize mutable string buffer
-        str_buffer = ctypes.create_string_buffer(str_len)
-
-        # write the actual device name to the buffer
-        libtiepie.LstDevGetName(id_kind_int, instr_id, str_buffer, str_len)
-
-        # convert to a normal python string
-        dev_name = str_buffer.value.decode('utf-8')
-
-        return dev_name
+        return get_string(libtiepie.LstDevGetName, id_kind_int, instr_id)
 
     def get_device_name_short(self, instr_id, id_kind="index"):
         """Get the short name of the device.
@@ -320,22 +313,7 @@ class DeviceList:
         # translate id kind str to int
         id_kind_int = self.ID_KINDS[id_kind]
 
-        # get length of device name string
-        str_len = libtiepie.LstDevGetNameShort(id_kind_int, instr_id, None, 0)
-
-        # initialize mutable string buffer
-        str_buffer = ctypes.create_string_buffer(str_len)
-
-        # write the actual device name to the buffer
-        libtiepie.LstDevGetNameShort(id_kind_int,
-                                     instr_id,
-                                     str_buffer,
-                                     str_len)
-
-        # convert to a normal python string
-        dev_name = str_buffer.value.decode('utf-8')
-
-        return dev_name
+        return get_string(libtiepie.LstDevGetNameShort, id_kind_int, instr_id)
 
     def get_device_name_shortest(self, instr_id, id_kind="index"):
         """Get the shortest name of the device.
@@ -353,21 +331,9 @@ class DeviceList:
         # translate id kind str to int
         id_kind_int = self.ID_KINDS[id_kind]
 
-        # get length of device name string
-        str_len = libtiepie.LstDevGetNameShortest(id_kind_int, instr_id,
-                                                  None, 0)
-
-        # initialize mutable string buffer
-        str_buffer = ctypes.create_string_buffer(str_len)
-
-        # write the actual device name to the buffer
-        libtiepie.LstDevGetNameShortest(id_kind_int, instr_id, str_buffer,
-                                        str_len)
-
-        # convert to a normal python string
-        dev_name = str_buffer.value.decode('utf-8')
-
-        return dev_name
+        return get_string(
+            libtiepie.LstDevGetNameShortest, id_kind_int, instr_id
+        )
 
     def get_device_serial_no(self, instr_id, id_kind="index"):
         """Get the serial number of the device.
@@ -518,8 +484,8 @@ class DeviceList:
         type_dict = {"Osc": False,
                      "Gen": False,
                      "I2C": False}
-        for key in self.DEVICE_TYPES:
-            if dev_types & self.DEVICE_TYPES[key]:
+        for key, value in self.DEVICE_TYPES.items():
+            if dev_types & value:
                 type_dict[key] = True
 
         return type_dict
@@ -690,21 +656,10 @@ class DeviceList:
         # translate id kind str to int
         id_kind_int = self.ID_KINDS[id_kind]
 
-        # get length of device name string
-        str_len = libtiepie.LstCbDevGetName(id_kind_int, instr_id,
-                                            contained_serial_no, None, 0)
-
-        # initialize mutable string buffer
-        str_buffer = ctypes.create_string_buffer(str_len)
-
-        # write the actual device name to the buffer
-        libtiepie.LstCbDevGetName(id_kind_int, instr_id, contained_serial_no,
-                                  str_buffer, str_len)
-
-        # convert to a normal python string
-        dev_name = str_buffer.value.decode('utf-8')
-
-        return dev_name
+        return get_string(libtiepie.LstCbDevGetName,
+                          id_kind_int,
+                          instr_id,
+                          contained_serial_no)
 
     def get_device_name_short_cb(self, instr_id, contained_serial_no,
                                  id_kind="index"):
@@ -724,22 +679,10 @@ class DeviceList:
         # translate id kind str to int
         id_kind_int = self.ID_KINDS[id_kind]
 
-        # get length of device name string
-        str_len = libtiepie.LstCbDevGetNameShort(id_kind_int, instr_id,
-                                                 contained_serial_no, None, 0)
-
-        # initialize mutable string buffer
-        str_buffer = ctypes.create_string_buffer(str_len)
-
-        # write the actual device name to the buffer
-        libtiepie.LstCbDevGetNameShort(id_kind_int, instr_id,
-                                       contained_serial_no,
-                                       str_buffer, str_len)
-
-        # convert to a normal python string
-        dev_name = str_buffer.value.decode('utf-8')
-
-        return dev_name
+        return get_string(libtiepie.LstCbDevGetNameShort,
+                          id_kind_int,
+                          instr_id,
+                          contained_serial_no)
 
     def get_device_name_shortest_cb(self, instr_id, contained_serial_no,
                                     id_kind="index"):
@@ -759,23 +702,10 @@ class DeviceList:
         # translate id kind str to int
         id_kind_int = self.ID_KINDS[id_kind]
 
-        # get length of device name string
-        str_len = libtiepie.LstCbDevGetNameShortest(id_kind_int, instr_id,
-                                                    contained_serial_no,
-                                                    None, 0)
-
-        # initialize mutable string buffer
-        str_buffer = ctypes.create_string_buffer(str_len)
-
-        # write the actual device name to the buffer
-        libtiepie.LstCbDevGetNameShortest(id_kind_int, instr_id,
-                                          contained_serial_no, str_buffer,
-                                          str_len)
-
-        # convert to a normal python string
-        dev_name = str_buffer.value.decode('utf-8')
-
-        return dev_name
+        return get_string(libtiepie.LstCbDevGetNameShortest,
+                          id_kind_int,
+                          instr_id,
+                          contained_serial_no)
 
     def get_driver_version_cb(self, instr_id, contained_serial_no,
                               id_kind="index"):
@@ -876,18 +806,7 @@ class DeviceList:
         return split_date
 
 
-def version_to_str(raw_version):
-    """Convert a raw version int in TiePie's format to a nice string.
-
-    Args:
-        raw_version (int): concatenated version numbers as int in TiePie's format
-
-    Returns:
-        str: version number as str
-    """
-    return '.'.join([str((raw_version >> (idx * 16)) & 0xffff) for idx in range(3, -1, -1)])
-
-
 # Instantiate class to make it available via import. Thus only one instance
-# exists (singleton design pattern).
-device_list = DeviceList()
+# exists (singleton design pattern). The list is filled on first use of the
+# library, so importing doesn't load the library yet.
+device_list = DeviceList(update=False)
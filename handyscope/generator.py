@@ -1,6 +1,7 @@
-from handyscope.library import libtiepie
+from handyscope.library import libtiepie, scratch
 from handyscope.device import Device
 import ctypes
+import numpy as np
 
 
 class Generator(Device):
@@ -784,17 +785,25 @@ class Generator(Device):
         set offset value. If value_list is empty, the buffer gets cleared.
 
         Args:
-            value_list (list): List with arbitrary data samples
+            value_list (list or :class:`numpy.ndarray`): Arbitrary data
+                                                         samples
+
+        Raises:
+            ValueError: If value_list is not one dimensional.
         """
-        list_len = len(value_list)
+        # Check the dimensions first, np.ascontiguousarray makes scalars 1-D
+        values = np.asarray(value_list, dtype=np.float32)
+        if values.ndim != 1:
+            raise ValueError("value_list must be one dimensional")
+        # Contiguous float32 arrays are passed on without a copy
+        values = np.ascontiguousarray(values)
 
-        if list_len == 0:
+        if values.size == 0:
             pointer = None
         else:
-            buffer = (ctypes.c_float * list_len)(*value_list)
-            pointer = ctypes.byref(buffer)
+            pointer = values.ctypes.data
 
-        libtiepie.GenSetData(self._dev_handle, pointer, list_len)
+        libtiepie.GenSetData(self._dev_handle, pointer, values.size)
 
     @property
     def arb_raw_type(self):
@@ -814,9 +823,7 @@ class Generator(Device):
             tuple: Minimum, zero, maximum raw value for the arbitrary data
                    buffer range as int.
         """
-        minimum = ctypes.c_uint64()
-        zero = ctypes.c_uint64()
-        maximum = ctypes.c_uint64()
+        minimum, zero, maximum = scratch(ctypes.c_uint64, 3)
 
         libtiepie.GenGetDataRawValueRange(
             self._dev_handle,
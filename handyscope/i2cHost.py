@@ -1,4 +1,9 @@
-from handyscope.library import libtiepie
+from handyscope.library import (
+    libtiepie,
+    scratch,
+    scratch_buffer,
+    check_last_status,
+)
 from handyscope.device import Device
 import ctypes
 
@@ -103,15 +108,16 @@ class I2CHost(Device):
         Returns:
             list of int: List with the received bytes.
         """
-        buffer = (ctypes.c_uint8 * no_bytes)()
-        libtiepie.I2CRead(
+        buffer = scratch_buffer(no_bytes)
+        if not libtiepie.I2CRead(
             self._dev_handle, 
             address, 
             ctypes.byref(buffer), 
             no_bytes, 
             send_stop
-        )
-        return list(buffer)
+        ):
+            check_last_status()
+        return list(ctypes.string_at(buffer, no_bytes))
 
     def read_byte(self, address):
         """Read one byte from the given address.
@@ -122,8 +128,11 @@ class I2CHost(Device):
         Returns:
             int: The received byte.
         """
-        buffer = ctypes.c_uint8()
-        libtiepie.I2CReadByte(self._dev_handle, address, ctypes.byref(buffer))
+        buffer, = scratch(ctypes.c_uint8, 1)
+        if not libtiepie.I2CReadByte(
+            self._dev_handle, address, ctypes.byref(buffer)
+        ):
+            check_last_status()
         return buffer.value
 
     def read_word(self, address):
@@ -135,8 +144,11 @@ class I2CHost(Device):
         Returns:
             int: The received word.
         """
-        buffer = ctypes.c_uint16()
-        libtiepie.I2CReadWord(self._dev_handle, address, ctypes.byref(buffer))
+        buffer, = scratch(ctypes.c_uint16, 1)
+        if not libtiepie.I2CReadWord(
+            self._dev_handle, address, ctypes.byref(buffer)
+        ):
+            check_last_status()
         return buffer.value
 
     def write(self, address, data, send_stop=True):
@@ -151,15 +163,16 @@ class I2CHost(Device):
         Returns:
             bool: True if write succeeded, False otherwise.
         """
-        data_len = len(data)
-        buffer = (ctypes.c_uint8 * data_len)(*data)
+        buffer = bytes(data)
         result = libtiepie.I2CWrite(
             self._dev_handle, 
             address, 
-            ctypes.byref(buffer), 
-            data_len, 
+            buffer, 
+            len(buffer), 
             send_stop
         )
+        if not result:
+            check_last_status()
 
         return result == 1
 
@@ -171,17 +184,18 @@ class I2CHost(Device):
             data (list of int): List of bytes to be written
             no_bytes  (int):  Number of bytes to read
         """
-        data_len = len(data)
-        write_buffer = (ctypes.c_uint8 * data_len)(*data)
-        read_buffer = (ctypes.c_ubyte * no_bytes)()
-        libtiepie.I2CWriteRead(
+        write_buffer = bytes(data)
+        read_buffer = scratch_buffer(no_bytes)
+        if not libtiepie.I2CWriteRead(
             self._dev_handle,
             address,
-            ctypes.byref(write_buffer),
-            data_len,
+            write_buffer,
+            len(write_buffer),
             ctypes.byref(read_buffer),
-        )
-        return list(read_buffer)
+            no_bytes,
+        ):
+            check_last_status()
+        return list(ctypes.string_at(read_buffer, no_bytes))
 
     def write_byte(self, address, data_byte):
         """Write the given byte to the address.
@@ -194,6 +208,8 @@ class I2CHost(Device):
             bool: True if write succeeded, False otherwise.
         """
         result = libtiepie.I2CWriteByte(self._dev_handle, address, data_byte)
+        if not result:
+            check_last_status()
 
         return result == 1
 
@@ -211,6 +227,8 @@ class I2CHost(Device):
         result = libtiepie.I2CWriteByteByte(
             self._dev_handle, address, data_byte1, data_byte2
         )
+        if not result:
+            check_last_status()
 
         return result == 1
 
@@ -225,6 +243,8 @@ class I2CHost(Device):
             bool: True if write succeeded, False otherwise.
         """
         result = libtiepie.I2CWriteWord(self._dev_handle, address, data_word)
+        if not result:
+            check_last_status()
 
         return result == 1
 
@@ -242,6 +262,8 @@ class I2CHost(Device):
         result = libtiepie.I2CWriteByteWord(
             self._dev_handle, address, data_byte, data_word
         )
+        if not result:
+            check_last_status()
 
         return result == 1
 
@@ -252,13 +274,14 @@ class I2CHost(Device):
             tuple of int: valid addresses
         """
         valid_addresses = []
+        internal_addresses = set(self.internal_adresses)
 
         # Only check allowed addresses: "Two groups of eight addresses
         # (0000 XXX and 1111 XXX) are reserved"
         # `see official I2C-bus specification and user manual
         # <http://www.nxp.com/documents/user_manual/UM10204.pdf>`_
         for address in range(0x08, 0x77):
-            if self.is_internal_address(address):
+            if address in internal_addresses:
                 continue
             else:
                 try:
@@ -1,13 +1,93 @@
 import ctypes
+import threading
 import time
 import warnings
 
 import numpy as np
 
 from handyscope.device import Device
-from handyscope.library import libtiepie
+from handyscope.library import libtiepie, Callback, scratch_buffer
 from handyscope.oscilloscopeChannel import OscilloscopeChannel
 
+# Time in s to poll without sleeping, to catch fast completions
+_SPIN_TIME = 200e-6
+# Sleep interval in s to start with, if no duration is expected
+_DELAY_MIN = 50e-6
+# Maximum sleep interval in s
+_DELAY_MAX = 0.05
+# Time in s before the expected end of a wait to start polling
+_DEADLINE_MARGIN = 0.005
+
+
+def _wait_until(
+    predicate,
+    expected_duration=None,
+    event=None,
+    poll_interval=None,
+    timeout=None,
+):
+    """Wait until a condition is met.
+
+    If a duration is expected, most of it is slept at once. The condition is
+    then polled without sleeping for a short time, and after that with
+    exponentially growing sleep intervals.
+
+    Args:
+        predicate (callable): Function returning True once the condition is
+                              met
+        expected_duration (float): (optional) Time in s, before which the
+                                   condition can not be met
+        event (threading.Event): (optional) Event which is set once the
+                                 condition is met, ends a sleep early
+        poll_interval (float): (optional) Fixed sleep interval in s, replaces
+                               the exponentially growing one
+        timeout (float): (optional) Maximum time to wait in s
+
+    Returns:
+        bool: True if the condition is met, False if the timeout elapsed.
+    """
+
+    def sleep(duration):
+        # Returns True if the event ended the sleep
+        if event is None:
+            time.sleep(duration)
+            return False
+        return event.wait(duration)
+
+    if timeout is not None:
+        deadline = time.perf_counter() + timeout
+
+    if expected_duration:
+        # A single sleep until shortly before the condition can be met
+        remaining = expected_duration - _DEADLINE_MARGIN
+        if timeout is not None:
+            remaining = min(remaining, timeout)
+        if remaining > 0 and sleep(remaining):
+            return True
+        delay = min(max(1e-5, expected_duration / 100), _DELAY_MAX)
+    else:
+        delay = _DELAY_MIN
+    if poll_interval is not None:
+        delay = poll_interval
+
+    start = time.perf_counter()
+    while time.perf_counter() - start < _SPIN_TIME:
+        if predicate():
+            return True
+
+    while not predicate():
+        if timeout is not None:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                return False
+            delay = min(delay, remaining)
+        if sleep(delay):
+            return True
+        if poll_interval is None:
+            delay = min(delay * 1.5, _DELAY_MAX)
+
+    return True
+
 
 class Oscilloscope(Device):
     """Class for an oscilloscope.
@@ -23,12 +103,17 @@ class Oscilloscope(Device):
                               libtiepie int version
         CONNECTION_STATES (dict): dict which maps connection states as strs to
                                   their libtiepie int version
+        POLL_INTERVAL (float): Time in s between polls while waiting for a
+                               measurement or connection test, None to adapt
+                               it to the expected duration
     """
 
-    __slots__ = ("_channels",)
+    __slots__ = ("_channels", "_has_connection_test")
 
     MEASURE_MODES = {"unknown": 0, "stream": 1, "block": 2}
 
+    _BLOCK_MODE = MEASURE_MODES["block"]
+
     AUTO_RESOLUTIONS = {
         "unknown": 0,
         "disabled": 1,
@@ -40,8 +125,30 @@ class Oscilloscope(Device):
 
     CLOCK_OUTPUTS = {"unknown": 0, "disabled": 1, "sample": 2, "fixed": 4}
 
+    # Reverse lookups from the libtiepie int to the str
+    _MEASURE_MODES_INV = {v: k for k, v in MEASURE_MODES.items()}
+    _AUTO_RESOLUTIONS_INV = {v: k for k, v in AUTO_RESOLUTIONS.items()}
+    _CLOCK_SOURCES_INV = {v: k for k, v in CLOCK_SOURCES.items()}
+    _CLOCK_OUTPUTS_INV = {v: k for k, v in CLOCK_OUTPUTS.items()}
+
+    # Bit flags of the *_available properties, "unknown" is handled apart
+    _MEASURE_MODE_FLAGS = tuple(
+        (k, v) for k, v in MEASURE_MODES.items() if k != "unknown"
+    )
+    _AUTO_RESOLUTION_FLAGS = tuple(
+        (k, v) for k, v in AUTO_RESOLUTIONS.items() if k != "unknown"
+    )
+    _CLOCK_SOURCE_FLAGS = tuple(
+        (k, v) for k, v in CLOCK_SOURCES.items() if k != "unknown"
+    )
+    _CLOCK_OUTPUT_FLAGS = tuple(
+        (k, v) for k, v in CLOCK_OUTPUTS.items() if k != "unknown"
+    )
+
     CONNECTION_STATES = {"undefined": 0, "connected": 1, "disconnected": 2}
 
+    _CONNECTION_STATES_INV = {v: k for k, v in CONNECTION_STATES.items()}
+
     DATA_TYPES = {
         "int8": ctypes.c_int8,
         "int16": ctypes.c_int16,
@@ -57,6 +164,13 @@ class Oscilloscope(Device):
 
     TRIG_HOLDOFF_ALL_PRE_SAMPLES = 0xFFFFFFFFFFFFFFFF
 
+    POLL_INTERVAL = None
+
+    # libtiepie functions to get the data of channel 1 to n, index n
+    _GET_DATA_N_CH = (None,) + tuple(
+        "ScpGetData%dCh" % n for n in range(1, 9)
+    )
+
     _device_type = "Osc"
 
     def __init__(self, instr_id, id_kind="product id"):
@@ -70,10 +184,14 @@ class Oscilloscope(Device):
         """
         super().__init__(instr_id, id_kind, self._device_type)
 
+        self._has_connection_test = None
+
         # Initialize channels
         self._channels = tuple(
             OscilloscopeChannel(self._dev_handle, ch_idx)
-            for ch_idx in range(self.channel_cnt)
+            for ch_idx in range(
+                libtiepie.ScpGetChannelCount(self._dev_handle)
+            )
         )
 
     @property
@@ -83,7 +201,8 @@ class Oscilloscope(Device):
         Returns:
             int: The channel count
         """
-        return libtiepie.ScpGetChannelCount(self._dev_handle)
+        # The channel count of a device is fixed
+        return len(self._channels)
 
     @property
     def channels(self):
@@ -95,6 +214,34 @@ class Oscilloscope(Device):
         """
         return self._channels
 
+    @property
+    def enabled_mask(self):
+        """Get or set the enabled channels as a bit mask.
+
+        Bit n of the mask stands for channel n + 1. Setting the mask only
+        writes the channels whose state changes.
+
+        Returns:
+            int: Bit mask of the enabled channels
+        """
+        dev_handle = self._dev_handle
+        mask = 0
+        for idx in range(len(self._channels)):
+            if libtiepie.ScpChGetEnabled(dev_handle, idx) == 1:
+                mask |= 1 << idx
+        return mask
+
+    @enabled_mask.setter
+    def enabled_mask(self, value):
+        channel_cnt = len(self._channels)
+        if value < 0 or value >> channel_cnt:
+            raise ValueError("Invalid channel mask: %d" % value)
+        dev_handle = self._dev_handle
+        for idx in range(channel_cnt):
+            is_enabled = (value >> idx) & 1 == 1
+            if (libtiepie.ScpChGetEnabled(dev_handle, idx) == 1) != is_enabled:
+                libtiepie.ScpChSetEnabled(dev_handle, idx, is_enabled)
+
     def _get_sample_cnts(self):
         """Get information on the sample counts.
 
@@ -106,45 +253,98 @@ class Oscilloscope(Device):
         Returns:
             tuple: sample start count and valid sample count as ints
         """
+        # Query every value only once and compare the raw measure mode to
+        # skip the str conversion of measure_mode
+        dev_handle = self._dev_handle
+        record_length = libtiepie.ScpGetRecordLength(dev_handle)
         # Calc number of valid samples
-        if self.measure_mode == "block":
+        if libtiepie.ScpGetMeasureMode(dev_handle) == self._BLOCK_MODE:
             post_sample_cnt = round(
-                (1.0 - self.pre_sample_ratio) * self.record_length
+                (1.0 - libtiepie.ScpGetPreSampleRatio(dev_handle))
+                * record_length
+            )
+            valid_sample_cnt = (
+                post_sample_cnt
+                + libtiepie.ScpGetValidPreSampleCount(dev_handle)
             )
-            valid_sample_cnt = post_sample_cnt + self.valid_pre_sample_cnt
             # Calc sample start count
-            sample_start_cnt = self.record_length - valid_sample_cnt
+            sample_start_cnt = record_length - valid_sample_cnt
         else:
             sample_start_cnt = 0
-            valid_sample_cnt = self.record_length
+            valid_sample_cnt = record_length
 
         return sample_start_cnt, valid_sample_cnt
 
-    def retrieve(self, channel_nos=None, raw=False):
-        """Retrieve measured samples.
+    @staticmethod
+    def _convert_buffers(buffers, as_numpy):
+        """Convert filled buffers to the returned sample format.
 
-        Previously to retrieving data, a measurement has to be started.
-        If no channel numbers are given, all enabled channels are retrieved.
+        Args:
+            buffers (list): numpy arrays, or None for skipped channels
+            as_numpy (bool): True, if numpy arrays should be returned
+
+        Returns:
+            list: List with None or the samples for each buffer.
+        """
+        if as_numpy:
+            return buffers
+        # Converting in one pass is much faster than iterating in python
+        return [None if buffer is None else buffer.tolist()
+                for buffer in buffers]
+
+    @staticmethod
+    def _rows_as_buffers(array_2d, selected):
+        """Distribute the rows of a 2D array to the selected channels.
 
         Args:
-            channel_nos (list): (optional) iterable with channel numbers to
-                                retrieve, or None
-            raw (bool): True, if raw data should be returned.
+            array_2d (numpy.ndarray): Array with a row for each selected
+                                      channel
+            selected (list): Entry for each channel, which is falsy (None or
+                             False) if the channel is skipped
 
         Returns:
-            list: List with entries for each channel. An entry contains None,
-                  if the channel is disabled, otherwise a list of samples.
+            list: Row for each selected channel, None for skipped channels
+        """
+        rows = iter(array_2d)
+        return [next(rows) if entry else None for entry in selected]
+
+    @staticmethod
+    def _buffer_pointers(buffers):
+        """Get the addresses of buffers to pass them to libtiepie.
+
+        Args:
+            buffers (list): numpy arrays, or None for skipped channels
+
+        Returns:
+            list: Address of each buffer, or None (a NULL pointer)
+        """
+        return [None if buffer is None else buffer.ctypes.data
+                for buffer in buffers]
+
+    def _check_channel_nos(self, channel_nos):
+        """Check the channel numbers to retrieve.
+
+        Args:
+            channel_nos (list): iterable with channel numbers, or None for
+                                all enabled channels
+
+        Returns:
+            set: The channel numbers to retrieve.
         """
+        channels = self._channels
         # If no channel numbers are given, get the active ones
         if channel_nos is None:
-            channel_nos = []
-            for channel in self.channels:
-                if channel.is_enabled:
-                    channel_nos.append(channel._idx + 1)
+            channel_nos = {
+                idx + 1
+                for idx, channel in enumerate(channels)
+                if channel.is_enabled
+            }
         # Else check that the given channels are enabled
         else:
-            for channel_no in channel_nos:
-                if self.channels[channel_no - 1].is_enabled is False:
+            # A set allows fast lookups and reads every channel once
+            channel_nos = set(channel_nos)
+            for channel_no in sorted(channel_nos):
+                if channels[channel_no - 1].is_enabled is False:
                     raise ValueError(
                         "The given channel %d is not enabled. It has to be "
                         "enabled before " % channel_no
@@ -158,24 +358,24 @@ class Oscilloscope(Device):
                 " number list is empty."
             )
 
-        # Get number of valid samples
-        sample_start_cnt, valid_sample_cnt = self._get_sample_cnts()
+        return channel_nos
 
-        # Initialize buffer
-        channel_cnt = max(channel_nos)
-        buffers = [None] * channel_cnt
-        pointer_array = libtiepie.HlpPointerArrayNew(channel_cnt)
-        for idx in range(channel_cnt):
-            if idx + 1 in channel_nos:
-                if raw:
-                    raw_type = self.channels[idx].raw_data_type
-                    c_type = self.DATA_TYPES[raw_type]
-                else:
-                    c_type = ctypes.c_float
-                buffers[idx] = (c_type * valid_sample_cnt)()
-                libtiepie.HlpPointerArraySet(
-                    pointer_array, idx, ctypes.byref(buffers[idx])
-                )
+    def _get_data(self, buffers, raw, sample_start_cnt, valid_sample_cnt):
+        """Let libtiepie write the measured samples into buffers.
+
+        Args:
+            buffers (list): numpy arrays for channel 1 to len(buffers), or
+                            None for skipped channels
+            raw (bool): True, if raw data should be written
+            sample_start_cnt (int): Index of the first sample
+            valid_sample_cnt (int): Number of samples to write
+        """
+        channel_cnt = len(buffers)
+        # libtiepie expects a plain C array of buffer pointers, so build it
+        # here instead of calling the HlpPointerArray* helpers per channel
+        pointer_array = (ctypes.c_void_p * channel_cnt)(
+            *self._buffer_pointers(buffers)
+        )
 
         if raw:
             libtiepie.ScpGetDataRaw(
@@ -194,283 +394,346 @@ class Oscilloscope(Device):
                 valid_sample_cnt,
             )
 
-        # Free pointer array
-        libtiepie.HlpPointerArrayDelete(pointer_array)
-
-        # Cast ctypes float array to normal python lists
-        data = [
-            None if channel_data is None else list(channel_data)
-            for channel_data in buffers
-        ]
-
-        return data
-
-    def retrieve_ch1(self):
-        """Retrieve measured samples of channel 1.
+    def retrieve(
+        self, channel_nos=None, raw=False, as_numpy=False, as_array_2d=False
+    ):
+        """Retrieve measured samples.
 
         Previously to retrieving data, a measurement has to be started.
+        If no channel numbers are given, all enabled channels are retrieved.
+
+        Args:
+            channel_nos (list): (optional) iterable with channel numbers to
+                                retrieve, or None
+            raw (bool): True, if raw data should be returned.
+            as_numpy (bool): True, if the samples should be returned as
+                             numpy arrays instead of lists. The arrays share
+                             memory with the buffers filled by libtiepie, no
+                             copy is made.
+            as_array_2d (bool): True, if the samples should be returned as a
+                                single 2D numpy array.
 
         Returns:
-            list: List with an entry for channel 1. The entry contains None,
-                  if channel 1 is disabled, otherwise a list of samples.
+            list or numpy.ndarray: List with entries for each channel. An
+                entry contains None, if the channel is disabled, otherwise
+                the samples. With as_array_2d, an array with a row for each
+                retrieved channel in ascending channel order instead.
         """
-        # Check availability
-        if self.channels[0].is_enabled:
-            # Get number of valid samples
-            sample_start_cnt, valid_sample_cnt = self._get_sample_cnts()
+        channel_nos = self._check_channel_nos(channel_nos)
 
-            # Init buffer
-            buffer = (ctypes.c_float * valid_sample_cnt)()
-
-            libtiepie.ScpGetData1Ch(
-                self._dev_handle, buffer, sample_start_cnt, valid_sample_cnt
-            )
+        # Get number of valid samples
+        sample_start_cnt, valid_sample_cnt = self._get_sample_cnts()
 
-            # Cast ctypes float array to normal python list
-            data = list(buffer)
+        return self._retrieve_channels(
+            channel_nos, raw, as_numpy, as_array_2d,
+            sample_start_cnt, valid_sample_cnt
+        )
 
-            return [data]
-        else:
-            return [None]
+    def retrieve_last_n(
+        self, n, channel_nos=None, raw=False, as_numpy=False,
+        as_array_2d=False
+    ):
+        """Retrieve the last measured samples.
 
-    def retrieve_ch1_to_ch2(self):
-        """Retrieve measured samples of channel 1 and 2.
+        Like :py:meth:`handyscope.oscilloscope.Oscilloscope.retrieve`, but
+        only the last n valid samples of each channel are copied.
 
-        Previously to retrieving data, a measurement has to be started.
+        Args:
+            n (int): Maximum number of samples to retrieve per channel.
+            channel_nos (list): (optional) iterable with channel numbers to
+                                retrieve, or None
+            raw (bool): True, if raw data should be returned.
+            as_numpy (bool): True, if the samples should be returned as
+                             numpy arrays instead of lists.
+            as_array_2d (bool): True, if the samples should be returned as a
+                                single 2D numpy array.
 
         Returns:
-            list: List with entries for each channel. An entry contains None,
-                  if the channel is disabled, otherwise a list of samples.
+            list or numpy.ndarray: The samples as returned by
+                :py:meth:`handyscope.oscilloscope.Oscilloscope.retrieve`
         """
-        # Get number of valid samples
+        if n < 0:
+            raise ValueError("n must not be negative, got %d." % n)
+        channel_nos = self._check_channel_nos(channel_nos)
+
+        # The valid samples end with the record, so skip all but the last n
         sample_start_cnt, valid_sample_cnt = self._get_sample_cnts()
+        if valid_sample_cnt > n:
+            sample_start_cnt += valid_sample_cnt - n
+            valid_sample_cnt = n
 
-        # Init buffers list for channel 1 & 2
-        buffers = [None] * 2
+        return self._retrieve_channels(
+            channel_nos, raw, as_numpy, as_array_2d,
+            sample_start_cnt, valid_sample_cnt
+        )
 
-        for idx in range(len(buffers)):
-            # Check availability
-            if idx < len(self.channels):
-                if self.channels[idx].is_enabled:
-                    buffers[idx] = (ctypes.c_float * valid_sample_cnt)()
+    def _retrieve_channels(
+        self, channel_nos, raw, as_numpy, as_array_2d,
+        sample_start_cnt, valid_sample_cnt
+    ):
+        """Retrieve a range of samples of the given channels.
 
-        libtiepie.ScpGetData2Ch(
-            self._dev_handle, *buffers, sample_start_cnt, valid_sample_cnt
-        )
+        Args:
+            channel_nos (set): Checked channel numbers to retrieve
+            raw (bool): True, if raw data should be returned
+            as_numpy (bool): True, if numpy arrays should be returned
+            as_array_2d (bool): True, if a single 2D array should be returned
+            sample_start_cnt (int): Index of the first sample
+            valid_sample_cnt (int): Number of samples to retrieve
 
-        # Cast ctypes float array to normal python lists
-        data = [
-            None if channel_data is None else list(channel_data)
-            for channel_data in buffers
+        Returns:
+            list or numpy.ndarray: The samples, see
+                :py:meth:`handyscope.oscilloscope.Oscilloscope.retrieve`
+        """
+        # Get the data type for every channel to retrieve
+        channels = self._channels
+        data_types = [
+            None if idx + 1 not in channel_nos
+            else channels[idx].raw_data_type if raw
+            else "float32"
+            for idx in range(max(channel_nos))
         ]
 
-        return data
+        # Initialize buffers as rows of a single allocation, libtiepie
+        # overwrites all samples, so skip zeroing them
+        data_type_set = set(data_types) - {None}
+        if len(data_type_set) == 1:
+            array_2d = np.empty(
+                (len(channel_nos), valid_sample_cnt), dtype=data_type_set.pop()
+            )
+            buffers = self._rows_as_buffers(array_2d, data_types)
+        elif as_array_2d:
+            raise ValueError(
+                "The raw data types of the channels differ, they can not "
+                "be retrieved as a single array."
+            )
+        else:
+            buffers = [
+                None if data_type is None
+                else np.empty(valid_sample_cnt, dtype=data_type)
+                for data_type in data_types
+            ]
 
-    def retrieve_ch1_to_ch3(self):
-        """Retrieve measured samples of channel 1 to 3.
+        self._get_data(buffers, raw, sample_start_cnt, valid_sample_cnt)
 
-        Previously to retrieving data, a measurement has to be started.
+        if as_array_2d:
+            return array_2d
+        return self._convert_buffers(buffers, as_numpy)
+
+    def retrieve_into(self, out_arrays, raw=False):
+        """Retrieve measured samples into preallocated arrays.
+
+        Like :py:meth:`handyscope.oscilloscope.Oscilloscope.retrieve`, but
+        libtiepie writes the samples directly into the given arrays. As long
+        as record length and pre sample ratio stay the same, the arrays can
+        be allocated once and reused for every measurement.
+
+        Args:
+            out_arrays (list): Entry for each channel, starting with channel
+                               1. None skips the channel, otherwise a
+                               writeable, contiguous numpy array of float32
+                               (or the raw data type of the channel, if raw)
+                               with at least record length samples.
+            raw (bool): True, if raw data should be retrieved.
 
         Returns:
-            list: List with entries for each channel. An entry contains None,
-                  if the channel is disabled, otherwise a list of samples.
+            int: Number of valid samples written to the start of each array.
         """
+        channel_nos = self._check_channel_nos(
+            idx + 1 for idx, array in enumerate(out_arrays)
+            if array is not None
+        )
+
         # Get number of valid samples
         sample_start_cnt, valid_sample_cnt = self._get_sample_cnts()
 
-        # Init buffers list for channel 1 to 3
-        buffers = [None] * 3
-
-        for idx in range(len(buffers)):
-            # Check availability
-            if idx < len(self.channels):
-                if self.channels[idx].is_enabled:
-                    buffers[idx] = (ctypes.c_float * valid_sample_cnt)()
-
-        libtiepie.ScpGetData3Ch(
-            self._dev_handle, *buffers, sample_start_cnt, valid_sample_cnt
-        )
+        channels = self._channels
+        buffers = list(out_arrays[:max(channel_nos)])
+        for idx, array in enumerate(buffers):
+            if array is None:
+                continue
+            data_type = channels[idx].raw_data_type if raw else "float32"
+            if (
+                not isinstance(array, np.ndarray)
+                or array.dtype != data_type
+                or not array.flags.c_contiguous
+                or not array.flags.writeable
+                or array.size < valid_sample_cnt
+            ):
+                raise ValueError(
+                    "The array for channel %d has to be a writeable, "
+                    "contiguous %s numpy array with at least %d samples."
+                    % (idx + 1, data_type, valid_sample_cnt)
+                )
 
-        # Cast ctypes float array to normal python lists
-        data = [
-            None if channel_data is None else list(channel_data)
-            for channel_data in buffers
-        ]
+        self._get_data(buffers, raw, sample_start_cnt, valid_sample_cnt)
 
-        return data
+        return valid_sample_cnt
 
-    def retrieve_ch1_to_ch4(self):
-        """Retrieve measured samples of channel 1 to 4.
+    def _retrieve_n(self, n, as_numpy):
+        """Retrieve measured samples of channel 1 to n.
 
-        Previously to retrieving data, a measurement has to be started.
+        Args:
+            n (int): Number of channels, from 1 to 8
+            as_numpy (bool): True, if numpy arrays should be returned
 
         Returns:
             list: List with entries for each channel. An entry contains None,
-                  if the channel is disabled, otherwise a list of samples.
+                  if the channel is disabled, otherwise the samples.
         """
+        # Init buffers list for channel 1 to n
+        buffers = [None] * n
+        enabled = [channel.is_enabled for channel in self.channels[:n]]
+        # Nothing to retrieve, if all available channels are disabled
+        if not any(enabled):
+            return buffers
+
         # Get number of valid samples
         sample_start_cnt, valid_sample_cnt = self._get_sample_cnts()
 
-        # Init buffers list for channel 1 to 4
-        buffers = [None] * 4
-
-        for idx in range(len(buffers)):
-            # Check availability
-            if idx < len(self.channels):
-                if self.channels[idx].is_enabled:
-                    buffers[idx] = (ctypes.c_float * valid_sample_cnt)()
-
-        libtiepie.ScpGetData4Ch(
-            self._dev_handle, *buffers, sample_start_cnt, valid_sample_cnt
+        # Rows of a single allocation, libtiepie overwrites all samples, so
+        # skip zeroing them
+        array_2d = np.empty(
+            (sum(enabled), valid_sample_cnt), dtype=np.float32
         )
+        buffers[:len(enabled)] = self._rows_as_buffers(array_2d, enabled)
 
-        # Cast ctypes float array to normal python lists
-        data = [
-            None if channel_data is None else list(channel_data)
-            for channel_data in buffers
-        ]
+        getattr(libtiepie, self._GET_DATA_N_CH[n])(
+            self._dev_handle,
+            *self._buffer_pointers(buffers),
+            sample_start_cnt,
+            valid_sample_cnt,
+        )
 
-        return data
+        return self._convert_buffers(buffers, as_numpy)
 
-    def retrieve_ch1_to_ch5(self):
-        """Retrieve measured samples of channel 1 to 5.
+    def retrieve_ch1(self, as_numpy=False):
+        """Retrieve measured samples of channel 1.
 
         Previously to retrieving data, a measurement has to be started.
 
-        Not tested.
+        Args:
+            as_numpy (bool): True, if the samples should be returned as
+                             numpy arrays instead of lists.
 
         Returns:
-            list: List with entries for each channel. An entry contains None,
-                  if the channel is disabled, otherwise a list of samples.
+            list: List with an entry for channel 1. The entry contains None,
+                  if channel 1 is disabled, otherwise the samples.
         """
-        # Get number of valid samples
-        sample_start_cnt, valid_sample_cnt = self._get_sample_cnts()
+        return self._retrieve_n(1, as_numpy)
 
-        # Init buffers list for channel 1 to 5
-        buffers = [None] * 5
-
-        for idx in range(len(buffers)):
-            # Check availability
-            if idx < len(self.channels):
-                if self.channels[idx].is_enabled:
-                    buffers[idx] = (ctypes.c_float * valid_sample_cnt)()
+    def retrieve_ch1_to_ch2(self, as_numpy=False):
+        """Retrieve measured samples of channel 1 and 2.
 
-        libtiepie.ScpGetData5Ch(
-            self._dev_handle, *buffers, sample_start_cnt, valid_sample_cnt
-        )
+        Previously to retrieving data, a measurement has to be started.
 
-        # Cast ctypes float array to normal python lists
-        data = [
-            None if channel_data is None else list(channel_data)
-            for channel_data in buffers
-        ]
+        Args:
+            as_numpy (bool): True, if the samples should be returned as
+                             numpy arrays instead of lists.
 
-        return data
+        Returns:
+            list: List with entries for each channel. An entry contains None,
+                  if the channel is disabled, otherwise the samples.
+        """
+        return self._retrieve_n(2, as_numpy)
 
-    def retrieve_ch1_to_ch6(self):
-        """Retrieve measured samples of channel 1 to 6.
+    def retrieve_ch1_to_ch3(self, as_numpy=False):
+        """Retrieve measured samples of channel 1 to 3.
 
         Previously to retrieving data, a measurement has to be started.
 
-        Not tested.
+        Args:
+            as_numpy (bool): True, if the samples should be returned as
+                             numpy arrays instead of lists.
 
         Returns:
             list: List with entries for each channel. An entry contains None,
-                  if the channel is disabled, otherwise a list of samples.
+                  if the channel is disabled, otherwise the samples.
         """
-        # Get number of valid samples
-        sample_start_cnt, valid_sample_cnt = self._get_sample_cnts()
-
-        # Init buffers list for channel 1 to 6
-        buffers = [None] * 6
+        return self._retrieve_n(3, as_numpy)
 
-        for idx in range(len(buffers)):
-            # Check availability
-            if idx < len(self.channels):
-                if self.channels[idx].is_enabled:
-                    buffers[idx] = (ctypes.c_float * valid_sample_cnt)()
+    def retrieve_ch1_to_ch4(self, as_numpy=False):
+        """Retrieve measured samples of channel 1 to 4.
 
-        libtiepie.ScpGetData6Ch(
-            self._dev_handle, *buffers, sample_start_cnt, valid_sample_cnt
-        )
+        Previously to retrieving data, a measurement has to be started.
 
-        # Cast ctypes float array to normal python lists
-        data = [
-            None if channel_data is None else list(channel_data)
-            for channel_data in buffers
-        ]
+        Args:
+            as_numpy (bool): True, if the samples should be returned as
+                             numpy arrays instead of lists.
 
-        return data
+        Returns:
+            list: List with entries for each channel. An entry contains None,
+                  if the channel is disabled, otherwise the samples.
+        """
+        return self._retrieve_n(4, as_numpy)
 
-    def retrieve_ch1_to_ch7(self):
-        """Retrieve measured samples of channel 1 to 7.
+    def retrieve_ch1_to_ch5(self, as_numpy=False):
+        """Retrieve measured samples of channel 1 to 5.
 
         Previously to retrieving data, a measurement has to be started.
 
         Not tested.
 
+        Args:
+            as_numpy (bool): True, if the samples should be returned as
+                             numpy arrays instead of lists.
+
         Returns:
             list: List with entries for each channel. An entry contains None,
-                  if the channel is disabled, otherwise a list of samples.
+                  if the channel is disabled, otherwise the samples.
         """
-        # Get number of valid samples
-        sample_start_cnt, valid_sample_cnt = self._get_sample_cnts()
+        return self._retrieve_n(5, as_numpy)
 
-        # Init buffers list for channel 1 to 7
-        buffers = [None] * 7
+    def retrieve_ch1_to_ch6(self, as_numpy=False):
+        """Retrieve measured samples of channel 1 to 6.
 
-        for idx in range(len(buffers)):
-            # Check availability
-            if idx < len(self.channels):
-                if self.channels[idx].is_enabled:
-                    buffers[idx] = (ctypes.c_float * valid_sample_cnt)()
+        Previously to retrieving data, a measurement has to be started.
 
-        libtiepie.ScpGetData7Ch(
-            self._dev_handle, *buffers, sample_start_cnt, valid_sample_cnt
-        )
+        Not tested.
 
-        # Cast ctypes float array to normal python lists
-        data = [
-            None if channel_data is None else list(channel_data)
-            for channel_data in buffers
-        ]
+        Args:
+            as_numpy (bool): True, if the samples should be returned as
+                             numpy arrays instead of lists.
 
-        return data
+        Returns:
+            list: List with entries for each channel. An entry contains None,
+                  if the channel is disabled, otherwise the samples.
+        """
+        return self._retrieve_n(6, as_numpy)
 
-    def retrieve_ch1_to_ch8(self):
-        """Retrieve measured samples of channel 1 to 8.
+    def retrieve_ch1_to_ch7(self, as_numpy=False):
+        """Retrieve measured samples of channel 1 to 7.
 
         Previously to retrieving data, a measurement has to be started.
 
         Not tested.
 
+        Args:
+            as_numpy (bool): True, if the samples should be returned as
+                             numpy arrays instead of lists.
+
         Returns:
             list: List with entries for each channel. An entry contains None,
-                  if the channel is disabled, otherwise a list of samples.
+                  if the channel is disabled, otherwise the samples.
         """
-        # Get number of valid samples
-        sample_start_cnt, valid_sample_cnt = self._get_sample_cnts()
+        return self._retrieve_n(7, as_numpy)
 
-        # Init buffers list for channel 1 to 8
-        buffers = [None] * 8
+    def retrieve_ch1_to_ch8(self, as_numpy=False):
+        """Retrieve measured samples of channel 1 to 8.
 
-        for idx in range(len(buffers)):
-            # Check availability
-            if idx < len(self.channels):
-                if self.channels[idx].is_enabled:
-                    buffers[idx] = (ctypes.c_float * valid_sample_cnt)()
+        Previously to retrieving data, a measurement has to be started.
 
-        libtiepie.ScpGetData8Ch(
-            self._dev_handle, *buffers, sample_start_cnt, valid_sample_cnt
-        )
+        Not tested.
 
-        # Cast ctypes float array to normal python lists
-        data = [
-            None if channel_data is None else list(channel_data)
-            for channel_data in buffers
-        ]
+        Args:
+            as_numpy (bool): True, if the samples should be returned as
+                             numpy arrays instead of lists.
 
-        return data
+        Returns:
+            list: List with entries for each channel. An entry contains None,
+                  if the channel is disabled, otherwise the samples.
+        """
+        return self._retrieve_n(8, as_numpy)
 
     @property
     def valid_pre_sample_cnt(self):
@@ -505,6 +768,21 @@ class Oscilloscope(Device):
         """
         return libtiepie.ScpForceTrigger(self._dev_handle) == 1
 
+    @staticmethod
+    def _flags_to_keys(raw, flags):
+        """Get the keys of all bit flags set in a libtiepie int.
+
+        Args:
+            raw (int): Bit mask returned by libtiepie
+            flags (tuple): (key, value) pairs of the flags, without "unknown"
+
+        Returns:
+            tuple: Keys of the set flags, or ("unknown",) if raw is 0
+        """
+        if raw == 0:
+            return ("unknown",)
+        return tuple(key for key, value in flags if raw & value == value)
+
     @property
     def measure_modes_available(self):
         """Get the available measure modes.
@@ -513,36 +791,17 @@ class Oscilloscope(Device):
             tuple: Available measure modes (keys of :py:attr:`handyscope.oscilloscope.Oscilloscope.MEASURE_MODES`)
         """
         raw_modes = libtiepie.ScpGetMeasureModes(self._dev_handle)
-        _modes = []
-
-        # If no measure modes are available, return unknown
-        if raw_modes == self.MEASURE_MODES["unknown"]:
-            _modes.append("unknown")
-        # Else do a detailed analysis...
-        else:
-            # ... by iterating over every possible kind...
-            for key in self.MEASURE_MODES:
-                # ... and ignoring "unknown" (already handled above)
-                if key == "unknown":
-                    pass
-                elif (
-                    raw_modes & self.MEASURE_MODES[key]
-                    == self.MEASURE_MODES[key]
-                ):
-                    _modes.append(key)
-
-        return tuple(_modes)
+        return self._flags_to_keys(raw_modes, self._MEASURE_MODE_FLAGS)
 
     @property
     def measure_mode(self):
         """Get or set the current measure mode (keys of
         :py:attr:`handyscope.oscilloscope.Oscilloscope.MEASURE_MODES`)"""
         mode_int = libtiepie.ScpGetMeasureMode(self._dev_handle)
-        for key in self.MEASURE_MODES:
-            if mode_int == self.MEASURE_MODES[key]:
-                return key
-
-        raise ValueError("Unknown measure mode: %d" % mode_int)
+        try:
+            return self._MEASURE_MODES_INV[mode_int]
+        except KeyError:
+            raise ValueError("Unknown measure mode: %d" % mode_int) from None
 
     @measure_mode.setter
     def measure_mode(self, value):
@@ -624,10 +883,9 @@ class Oscilloscope(Device):
             self._dev_handle, ctypes.byref(res), res_len
         )
 
-        # convert to a normal python list
-        res = list(res)
-
-        return tuple(res)
+        # Slicing converts to a python list in C, much faster than
+        # iterating over the ctypes array
+        return tuple(res[:])
 
     @property
     def resolution(self):
@@ -655,25 +913,7 @@ class Oscilloscope(Device):
             tuple: Available auto resolutions (keys of :py:attr:`handyscope.oscilloscope.Oscilloscope.AUTO_RESOLUTIONS`)
         """
         raw_res = libtiepie.ScpGetAutoResolutionModes(self._dev_handle)
-        _res = []
-
-        # If no auto resolution modes are available, return unknown
-        if raw_res == self.AUTO_RESOLUTIONS["unknown"]:
-            _res.append("unknown")
-        # Else do a detailed analysis...
-        else:
-            # ... by iterating over every possible kind...
-            for key in self.AUTO_RESOLUTIONS:
-                # ... and ignoring "unknown" (already handled above)
-                if key == "unknown":
-                    pass
-                elif (
-                    raw_res & self.AUTO_RESOLUTIONS[key]
-                    == self.AUTO_RESOLUTIONS[key]
-                ):
-                    _res.append(key)
-
-        return tuple(_res)
+        return self._flags_to_keys(raw_res, self._AUTO_RESOLUTION_FLAGS)
 
     @property
     def auto_resolution(self):
@@ -681,11 +921,12 @@ class Oscilloscope(Device):
         :py:attr:`handyscope.oscilloscope.Oscilloscope.AUTO_RESOLUTIONS`)
         """
         raw_res = libtiepie.ScpGetAutoResolutionMode(self._dev_handle)
-        for key, value in self.AUTO_RESOLUTIONS.items():
-            if raw_res == value:
-                return key
-
-        raise ValueError("Unknown auto resolution mode: %d" % raw_res)
+        try:
+            return self._AUTO_RESOLUTIONS_INV[raw_res]
+        except KeyError:
+            raise ValueError(
+                "Unknown auto resolution mode: %d" % raw_res
+            ) from None
 
     @auto_resolution.setter
     def auto_resolution(self, value):
@@ -701,30 +942,17 @@ class Oscilloscope(Device):
             tuple: Available clock sources (keys of :py:attr:`handyscope.oscilloscope.Oscilloscope.CLOCK_SOURCES`)
         """
         raw_srcs = libtiepie.ScpGetClockSources(self._dev_handle)
-        srcs = []
-
-        if raw_srcs == self.CLOCK_SOURCES["unknown"]:
-            srcs.append("unknown")
-        else:
-            for key, value in self.CLOCK_SOURCES.items():
-                if key == "unknown":
-                    continue
-                else:
-                    if raw_srcs & value == value:
-                        srcs.append(key)
-
-        return tuple(srcs)
+        return self._flags_to_keys(raw_srcs, self._CLOCK_SOURCE_FLAGS)
 
     @property
     def clock_source(self):
         """Get or set the current clock source (key of
         :py:attr:`handyscope.oscilloscope.Oscilloscope.CLOCK_SOURCES`)"""
         src = libtiepie.ScpGetClockSource(self._dev_handle)
-        for key, value in self.CLOCK_SOURCES.items():
-            if src == value:
-                return key
-
-        raise ValueError("Unknown clock source: %d" % src)
+        try:
+            return self._CLOCK_SOURCES_INV[src]
+        except KeyError:
+            raise ValueError("Unknown clock source: %d" % src) from None
 
     @clock_source.setter
     def clock_source(self, value):
@@ -740,30 +968,17 @@ class Oscilloscope(Device):
             tuple: Available clock outputs (keys of :py:attr:`handyscope.oscilloscope.Oscilloscope.CLOCK_OUTPUTS`)
         """
         raw_outs = libtiepie.ScpGetClockOutputs(self._dev_handle)
-        outs = []
-
-        if raw_outs == self.CLOCK_OUTPUTS["unknown"]:
-            outs.append("unknown")
-        else:
-            for key, value in self.CLOCK_OUTPUTS.items():
-                if key == "unknown":
-                    pass
-                else:
-                    if raw_outs & value == value:
-                        outs.append(key)
-
-        return tuple(outs)
+        return self._flags_to_keys(raw_outs, self._CLOCK_OUTPUT_FLAGS)
 
     @property
     def clock_output(self):
         """Get or set the current clock output (key of
         :py:attr:`handyscope.oscilloscope.Oscilloscope.CLOCK_OUTPUTS`)"""
         out = libtiepie.ScpGetClockOutput(self._dev_handle)
-        for key, value in self.CLOCK_OUTPUTS.items():
-            if out == value:
-                return key
-
-        raise ValueError("Unknown clock output: %d" % out)
+        try:
+            return self._CLOCK_OUTPUTS_INV[out]
+        except KeyError:
+            raise ValueError("Unknown clock output: %d" % out) from None
 
     @clock_output.setter
     def clock_output(self, value):
@@ -787,10 +1002,8 @@ class Oscilloscope(Device):
             self._dev_handle, ctypes.byref(frequencies), frequencies_len
         )
 
-        # Convert to a normal python list
-        frequencies = tuple(frequencies)
-
-        return frequencies
+        # Slicing converts to a python list in C
+        return tuple(frequencies[:])
 
     @property
     def clock_source_frequency(self):
@@ -816,10 +1029,8 @@ class Oscilloscope(Device):
             self._dev_handle, ctypes.byref(frequencies), frequencies_len
         )
 
-        # Convert to a normal python list
-        frequencies = tuple(frequencies)
-
-        return frequencies
+        # Slicing converts to a python list in C
+        return tuple(frequencies[:])
 
     @property
     def clock_output_frequency(self):
@@ -1056,7 +1267,12 @@ class Oscilloscope(Device):
         Returns:
             bool: True if connection test is available, False otherwise.
         """
-        return libtiepie.ScpHasConnectionTest(self._dev_handle) == 1
+        # A hardware feature, which does not change
+        if self._has_connection_test is None:
+            self._has_connection_test = (
+                libtiepie.ScpHasConnectionTest(self._dev_handle) == 1
+            )
+        return self._has_connection_test
 
     def start_connection_test(self):
         """Start a connection test.
@@ -1083,35 +1299,24 @@ class Oscilloscope(Device):
             tuple: Tuple with the test result of each channel (key of
                    :py:attr:`handyscope.oscilloscope.Oscilloscope.CONNECTION_STATES`)
         """
-        # Initialize uint8 array
-        data = (ctypes.c_uint8 * self.channel_cnt)()
+        channel_cnt = self.channel_cnt
 
-        # Write the actual data to the array
+        # Write the data to the reusable uint8 buffer
+        data = scratch_buffer(channel_cnt)
         libtiepie.ScpGetConnectionTestData(
-            self._dev_handle, ctypes.byref(data), self.channel_cnt
+            self._dev_handle, ctypes.byref(data), channel_cnt
         )
 
-        # Convert to a normal python list
-        data = list(data)
-
-        # Evaluate
-        data_evaluated = []
-        for element in data:
-            result = None
-
-            # Try to look up the element
-            for key, value in self.CONNECTION_STATES.items():
-                if element == value:
-                    result = key
-
-            # If found append it to the output
-            if result is not None:
-                data_evaluated.append(result)
-            # Else throw an exception
-            else:
-                raise ValueError("Unknown connection state: %d" % element)
-
-        return tuple(data_evaluated)
+        # Evaluate, slicing copies the states out as a list of ints in C
+        try:
+            return tuple(
+                self._CONNECTION_STATES_INV[element]
+                for element in data[:channel_cnt]
+            )
+        except KeyError as error:
+            raise ValueError(
+                "Unknown connection state: %d" % error.args[0]
+            ) from None
 
     def test_connection(self):
         """Perform a connection test.
@@ -1121,17 +1326,102 @@ class Oscilloscope(Device):
                    :py:attr:`handyscope.oscilloscope.Oscilloscope.CONNECTION_STATES`)
         """
         if self.is_connection_test_available:
-            res = self.start_connection_test()
+            res = self._wait_with_callback(
+                "ScpSetCallbackConnectionTestCompleted",
+                self.start_connection_test,
+                lambda: libtiepie.ScpIsConnectionTestCompleted(
+                    self._dev_handle
+                ) == 1,
+            )
             if res is False:
                 raise IOError("Connection test could not be started.")
 
-            while not self.is_connection_test_completed:
-                time.sleep(0.1)
-
             return self.connection_test_data
         else:
             return None
 
+    def _wait_with_callback(
+        self,
+        set_callback,
+        start,
+        predicate,
+        expected_duration=None,
+        timeout=None,
+    ):
+        """Start an operation and wait until it is completed.
+
+        A libtiepie callback ends the wait as soon as the operation is
+        completed, the predicate is still polled as a fallback.
+
+        Args:
+            set_callback (str): Name of the libtiepie function to set the
+                                completion callback
+            start (callable): Function starting the operation, returning
+                              True if successful. None if the operation is
+                              already running.
+            predicate (callable): Function returning True once the operation
+                                  is completed
+            expected_duration (float): (optional) Expected duration in s
+            timeout (float): (optional) Maximum time to wait in s
+
+        Returns:
+            bool: False if start failed or the timeout elapsed, True
+                  otherwise.
+        """
+        completed = threading.Event()
+        callback = Callback(lambda p_data: completed.set())
+        set_callback = getattr(libtiepie, set_callback)
+        set_callback(self._dev_handle, callback, None)
+        try:
+            if start is not None and not start():
+                return False
+            return _wait_until(
+                predicate,
+                expected_duration,
+                completed,
+                self.POLL_INTERVAL,
+                timeout,
+            )
+        finally:
+            # The callback must not be called anymore once it is freed
+            set_callback(self._dev_handle, Callback(), None)
+
+    def wait_for_data_ready(self, timeout=None):
+        """Wait until the data of a started measurement is ready.
+
+        Args:
+            timeout (float): (optional) Maximum time to wait in s, waits
+                             without limit by default
+
+        Returns:
+            bool: True if the data is ready, False if the timeout elapsed.
+        """
+        dev_handle = self._dev_handle
+        return self._wait_with_callback(
+            "ScpSetCallbackDataReady",
+            None,
+            lambda: libtiepie.ScpIsDataReady(dev_handle) == 1,
+            timeout=timeout,
+        )
+
+    def wait_for_overflow(self, timeout=None):
+        """Wait until the data of a running stream measurement overflows.
+
+        Args:
+            timeout (float): (optional) Maximum time to wait in s, waits
+                             without limit by default
+
+        Returns:
+            bool: True if the data overflowed, False if the timeout elapsed.
+        """
+        dev_handle = self._dev_handle
+        return self._wait_with_callback(
+            "ScpSetCallbackDataOverflow",
+            None,
+            lambda: libtiepie.ScpIsDataOverflow(dev_handle) == 1,
+            timeout=timeout,
+        )
+
     def measure(self, safe=True):
         """Perform a single shot measurement.
 
@@ -1154,11 +1444,22 @@ class Oscilloscope(Device):
             list: List with entries for each channel. An entry contains None,
                   if the channel is disabled, otherwise a list of samples.
         """
-        if self.measure_mode == "block" and self.pre_sample_ratio > 0:
+        # The settings do not change while measuring, so read them once
+        dev_handle = self._dev_handle
+        is_block = libtiepie.ScpGetMeasureMode(dev_handle) == self._BLOCK_MODE
+        record_length = libtiepie.ScpGetRecordLength(dev_handle)
+        # Pre samples only exist in block mode, without them there is
+        # nothing to check before or after the measurement
+        pre_sample_cnt = 0
+        if is_block:
+            pre_sample_cnt = (
+                libtiepie.ScpGetPreSampleRatio(dev_handle) * record_length
+            )
+        if pre_sample_cnt > 0:
+            is_trig_holdoff_available = self.is_trig_holdoff_available
             if (
-                self.is_trig_holdoff_available
-                and self.trig_holdoff
-                < self.pre_sample_ratio * self.record_length
+                is_trig_holdoff_available
+                and self.trig_holdoff < pre_sample_cnt
             ):
                 warnings.warn(
                     "trig_holdoff is not set to record all pre samples. This "
@@ -1168,19 +1469,19 @@ class Oscilloscope(Device):
                     "a predictable time vector.",
                     UserWarning,
                 )
-        # Start measurement
-        self.start()
-
-        # Wait until measurement is finished
-        while not self.is_data_ready:
-            time.sleep(0.1)
+        # Start measurement and wait until it is finished
+        res = self._wait_with_callback(
+            "ScpSetCallbackDataReady",
+            self.start,
+            lambda: libtiepie.ScpIsDataReady(dev_handle) == 1,
+            record_length / libtiepie.ScpGetSampleFrequency(dev_handle),
+        )
+        if res is False:
+            raise IOError("Measurement could not be started.")
 
-        if self.measure_mode == "block":
-            if (
-                self.valid_pre_sample_cnt
-                < self.record_length * self.pre_sample_ratio
-            ):
-                if safe and self.is_trig_holdoff_available:
+        if pre_sample_cnt > 0:
+            if self.valid_pre_sample_cnt < pre_sample_cnt:
+                if safe and is_trig_holdoff_available:
                     raise ValueError("Not all presamples have been collected")
                 else:
                     warnings.warn(
@@ -1198,14 +1499,18 @@ class Oscilloscope(Device):
         Returns:
             :class:`numpy.ndarray`: Time vector
         """
-        time_vec = np.linspace(
-            0,
-            1 / self.sample_freq * self.record_length,
-            num=self.record_length,
-            endpoint=False,
-        )
-        if self.measure_mode == "block":
-            trig_idx = int(self.pre_sample_ratio * len(time_vec))
-            return time_vec - time_vec[trig_idx]
-        else:
-            return time_vec
+        dev_handle = self._dev_handle
+        sample_freq = libtiepie.ScpGetSampleFrequency(dev_handle)
+        record_length = libtiepie.ScpGetRecordLength(dev_handle)
+        is_block = libtiepie.ScpGetMeasureMode(dev_handle) == self._BLOCK_MODE
+
+        dt = 1 / sample_freq
+        time_vec = np.arange(record_length, dtype=np.float64)
+        time_vec *= dt
+        if is_block:
+            pre_sample_ratio = libtiepie.ScpGetPreSampleRatio(dev_handle)
+            if pre_sample_ratio > 0:
+                trig_idx = int(pre_sample_ratio * record_length)
+                time_vec -= dt * trig_idx
+
+        return time_vec
@@ -1,6 +1,8 @@
-from handyscope.library import libtiepie
+from handyscope.library import libtiepie, scratch
 import ctypes
 
+import numpy as np
+
 
 class OscilloscopeChannel:
     """Class for an oscilloscope channel.
@@ -66,6 +68,8 @@ class OscilloscopeChannel:
         "float64": 512,
     }
 
+    _RAW_DATA_TYPES_INV = {v: k for k, v in RAW_DATA_TYPES.items()}
+
     def __init__(self, dev_handle, ch_idx):
         """Constructor for an oscilloscope channel.
 
@@ -192,8 +196,8 @@ class OscilloscopeChannel:
             str: Connector type (key of :py:attr:`handyscope.oscilloscopeChannel.OscilloscopeChannel.CONNECTOR_TYPES`)
         """
         raw_type = libtiepie.ScpChGetConnectorType(self._dev_handle, self._idx)
-        for key in self.CONNECTOR_TYPES:
-            if raw_type == self.CONNECTOR_TYPES[key]:
+        for key, value in self.CONNECTOR_TYPES.items():
+            if raw_type == value:
                 return key
 
         raise ValueError("Unknown connector type: %d" % raw_type)
@@ -234,11 +238,11 @@ class OscilloscopeChannel:
         # else do a detailed analysis...
         else:
             # ... by iterating over every possible coupling...
-            for key in self.COUPLINGS:
+            for key, value in self.COUPLINGS.items():
                 # ... and ignoring "unknown" (already handled above)
                 if key == "unknown":
                     pass
-                elif raw_couplings & self.COUPLINGS[key] == self.COUPLINGS[key]:
+                elif raw_couplings & value == value:
                     _couplings.append(key)
 
         return tuple(_couplings)
@@ -248,8 +252,8 @@ class OscilloscopeChannel:
         """Get or set the current coupling (key of
         :py:attr:`handyscope.oscilloscopeChannel.OscilloscopeChannel.COUPLINGS`)."""
         raw_coupling = libtiepie.ScpChGetCoupling(self._dev_handle, self._idx)
-        for key in self.COUPLINGS:
-            if raw_coupling == self.COUPLINGS[key]:
+        for key, value in self.COUPLINGS.items():
+            if raw_coupling == value:
                 return key
 
         raise ValueError("Unknown coupling: %d" % raw_coupling)
@@ -369,11 +373,11 @@ class OscilloscopeChannel:
         # Else do a detailed analysis...
         else:
             # ...by iterating over every possible kind ...
-            for key in self.TRIGGER_KINDS:
+            for key, value in self.TRIGGER_KINDS.items():
                 # ...and ignoring "unknown" (already handled above)
                 if key == "unknown":
                     pass
-                elif raw_kinds & self.TRIGGER_KINDS[key] == self.TRIGGER_KINDS[key]:
+                elif raw_kinds & value == value:
                     _kinds.append(key)
 
         return tuple(_kinds)
@@ -383,8 +387,8 @@ class OscilloscopeChannel:
         """Get or set the current trigger kind (key of
         :py:attr:`handyscope.oscilloscopeChannel.OscilloscopeChannel.TRIGGER_KINDS`)"""
         raw_kind = libtiepie.ScpChTrGetKind(self._dev_handle, self._idx)
-        for key in self.TRIGGER_KINDS:
-            if raw_kind == self.TRIGGER_KINDS[key]:
+        for key, value in self.TRIGGER_KINDS.items():
+            if raw_kind == value:
                 return key
 
         raise ValueError("Unknown trigger kind: %d" % raw_kind)
@@ -440,14 +444,11 @@ class OscilloscopeChannel:
         # Else do a detailed analysis...
         else:
             # ...by iterating over every possible kind ...
-            for key in self.TRIGGER_LVL_MODES:
+            for key, value in self.TRIGGER_LVL_MODES.items():
                 # ...and ignoring "unknown" (already handled above)
                 if key == "unknown":
                     pass
-                elif (
-                    raw_modes & self.TRIGGER_LVL_MODES[key]
-                    == self.TRIGGER_LVL_MODES[key]
-                ):
+                elif raw_modes & value == value:
                     _modes.append(key)
 
         return tuple(_modes)
@@ -518,14 +519,11 @@ class OscilloscopeChannel:
         # Else do a detailed analysis...
         else:
             # ...by iterating over every possible kind ...
-            for key in self.TRIGGER_CONDITIONS:
+            for key, value in self.TRIGGER_CONDITIONS.items():
                 # ...and ignoring "unknown" (already handled above)
                 if key == "unknown":
                     pass
-                elif (
-                    raw_conds & self.TRIGGER_CONDITIONS[key]
-                    == self.TRIGGER_CONDITIONS[key]
-                ):
+                elif raw_conds & value == value:
                     _conds.append(key)
 
         return tuple(_conds)
@@ -599,19 +597,15 @@ class OscilloscopeChannel:
         Returns:
             bool: True if trigger is available, False otherwise.
         """
-        # TODO Check if both function calls are necessary. To be on the safe
-        # side, currently both are called. Check if trigger support is given
-        # under the currently selected measure mode
-        measure_mode_ok = (
+        # Check if trigger support is given under the currently selected
+        # measure mode and only then if the trigger is available with the
+        # current settings. The results depend on the settings and therefore
+        # are not cached.
+        return (
             libtiepie.ScpChHasTrigger(self._dev_handle, self._idx) == 1
-        )
-        # Check if trigger is available with current settings
-        settings_ok = (
-            libtiepie.ScpChTrIsAvailable(self._dev_handle, self._idx) == 1
+            and libtiepie.ScpChTrIsAvailable(self._dev_handle, self._idx) == 1
         )
 
-        return measure_mode_ok & settings_ok
-
     @property
     def is_triggered(self):
         """Check if the channel has been triggered.
@@ -649,9 +643,7 @@ class OscilloscopeChannel:
         Returns:
             tuple: Minimum and maximum values of the input range as float
         """
-        # Init floats
-        range_min = ctypes.c_double()
-        range_max = ctypes.c_double()
+        range_min, range_max = scratch(ctypes.c_double, 2)
 
         # Get data
         libtiepie.ScpChGetDataValueRange(
@@ -690,10 +682,7 @@ class OscilloscopeChannel:
             str: Raw data type of the measured data.
         """
         raw_type = libtiepie.ScpChGetDataRawType(self._dev_handle, self._idx)
-        for key, value in self.RAW_DATA_TYPES.items():
-            if raw_type == value:
-                return key
-        return key
+        return self._RAW_DATA_TYPES_INV.get(raw_type, "unknown")
 
     @property
     def raw_data_range(self):
@@ -703,9 +692,7 @@ class OscilloscopeChannel:
         Returns:
             tuple: Minimum, zero, maximum raw values.
         """
-        minimum = ctypes.c_uint64()
-        zero = ctypes.c_uint64()
-        maximum = ctypes.c_uint64()
+        minimum, zero, maximum = scratch(ctypes.c_uint64, 3)
 
         libtiepie.ScpChGetDataRawValueRange(
             self._dev_handle,
@@ -717,6 +704,35 @@ class OscilloscopeChannel:
 
         return minimum.value, zero.value, maximum.value
 
+    def rescale_raw(self, raw, out=None):
+        """Convert raw samples to values of the input range.
+
+        The conversion uses the current range settings of the channel, so
+        convert before changing them. Together with
+        ``Oscilloscope.retrieve(raw=True, as_numpy=True)`` this moves only
+        the raw samples through the library and converts them vectorized.
+
+        Args:
+            raw (numpy.ndarray): Raw samples
+            out (numpy.ndarray): (optional) float array to write the values
+                                 to
+
+        Returns:
+            numpy.ndarray: The values, float32 if out is not given
+        """
+        value_min, value_max = self.data_range
+        raw_min, _, raw_max = self.raw_data_range
+        gain = (value_max - value_min) / (raw_max - raw_min)
+
+        if out is None:
+            out = np.empty(np.shape(raw), dtype=np.float32)
+        # Linear mapping of [raw_min, raw_max] to [value_min, value_max]
+        np.subtract(raw, raw_min, out=out, dtype=out.dtype)
+        out *= gain
+        out += value_min
+
+        return out
+
     @property
     def raw_value_min(self):
         """Get the minimum raw value for the input range of the measured data.
@@ -1,5 +1,4 @@
-import ctypes
-from handyscope.library import libtiepie
+from handyscope.library import libtiepie, get_string
 
 
 class TriggerInput:
@@ -40,32 +39,18 @@ class TriggerInput:
     @property
     def trigger_id(self):
         raw_id = libtiepie.DevTrInGetId(self._dev_handle, self._idx)
-        for key in self.TRIGGER_IDS:
-            if self.TRIGGER_IDS[key] == raw_id:
+        for key, value in self.TRIGGER_IDS.items():
+            if value == raw_id:
                 return key
 
         raise ValueError("Unknown trigger input id %d" % raw_id)
 
     @property
     def name(self):
-        # get length of name string
-        str_len = libtiepie.DevTrInGetName(
-            self._dev_handle, self._idx, None, 0
+        return get_string(
+            libtiepie.DevTrInGetName, self._dev_handle, self._idx
         )
 
-        # initialize mutable string buffer
-        str_buffer = ctypes.create_string_buffer(str_len)
-
-        # write the actual name to the buffer
-        libtiepie.DevTrInGetName(
-            self._dev_handle, self._idx, str_buffer, str_len
-        )
-
-        # convert to a normal python string
-        name = str_buffer.value.decode("utf-8")
-
-        return name
-
     @property
     def kinds_available(self):
         raw_kinds = libtiepie.DevTrInGetKinds(self._dev_handle, self._idx)
@@ -77,11 +62,11 @@ class TriggerInput:
         # Else do a detailed analysis...
         else:
             # ...by iterating over every possible kind ...
-            for key in self.TRIGGER_KINDS:
+            for key, value in self.TRIGGER_KINDS.items():
                 # ...and ignoring "unknown" (already handled above)
                 if key == "unknown":
                     pass
-                elif raw_kinds & self.TRIGGER_KINDS[key] == self.TRIGGER_KINDS[key]:
+                elif raw_kinds & value == value:
                     _kinds.append(key)
 
         return _kinds
@@ -89,8 +74,8 @@ class TriggerInput:
     @property
     def kind(self):
         raw_kind = libtiepie.DevTrInGetKind(self._dev_handle, self._idx)
-        for key in self.TRIGGER_KINDS:
-            if raw_kind == self.TRIGGER_KINDS[key]:
+        for key, value in self.TRIGGER_KINDS.items():
+            if raw_kind == value:
                 return key
 
         raise ValueError("Unknown trigger kind: %d" % raw_kind)
@@ -1,10 +1,9 @@
-from handyscope.library import libtiepie
-import ctypes
+from handyscope.library import libtiepie, get_string
 
 
 class TriggerOutput:
 
-    __slots__ = ("_dev_handle", "_idx")
+    __slots__ = ("_dev_handle", "_idx", "_trigger_id", "_name")
 
     TRIGGER_EVENTS = {
         "unknown": 0,
@@ -23,9 +22,18 @@ class TriggerOutput:
         "EXT 3": 0 << 24 | 3 << 20 | 3 << 8 | 0,
     }
 
+    # Reverse lookups from the libtiepie int to the str
+    _TRIGGER_EVENTS_INV = {v: k for k, v in TRIGGER_EVENTS.items()}
+    _TRIGGER_IDS_INV = {v: k for k, v in TRIGGER_IDS.items()}
+    # Event bit flags without "unknown"
+    _EVENTS_BY_BIT = {v: k for k, v in TRIGGER_EVENTS.items() if v}
+
     def __init__(self, dev_handle, trig_out_idx):
         self._dev_handle = dev_handle
         self._idx = trig_out_idx
+        # Fixed by the hardware, read on first use
+        self._trigger_id = None
+        self._name = None
 
     @property
     def is_enabled(self):
@@ -37,61 +45,53 @@ class TriggerOutput:
 
     @property
     def trigger_id(self):
-        raw_id = libtiepie.DevTrOutGetId(self._dev_handle, self._idx)
-        for key in self.TRIGGER_IDS:
-            if self.TRIGGER_IDS[key] == raw_id:
-                return key
+        if self._trigger_id is None:
+            raw_id = libtiepie.DevTrOutGetId(self._dev_handle, self._idx)
+            try:
+                self._trigger_id = self._TRIGGER_IDS_INV[raw_id]
+            except KeyError:
+                raise ValueError(
+                    "Unknown trigger output id %d" % raw_id
+                ) from None
 
-        raise ValueError("Unknown trigger output id %d" % raw_id)
+        return self._trigger_id
 
     @property
     def name(self):
-        # get length of name string
-        str_len = libtiepie.DevTrOutGetName(
-            self._dev_handle, self._idx, None, 0
-        )
-
-        # initialize mutable string buffer
-        str_buffer = ctypes.create_string_buffer(str_len)
-
-        # write the actual name to the buffer
-        libtiepie.DevTrOutGetName(
-            self._dev_handle, self._idx, str_buffer, str_len
-        )
-
-        # convert to a normal python string
-        name = str_buffer.value.decode("utf-8")
-
-        return name
+        if self._name is None:
+            self._name = get_string(
+                libtiepie.DevTrOutGetName, self._dev_handle, self._idx
+            )
+        return self._name
 
     @property
     def events_available(self):
         raw_events = libtiepie.DevTrOutGetEvents(self._dev_handle, self._idx)
-        _events = []
 
-        # if no trigger evvents are available, return unknown
+        # if no trigger events are available, return unknown
         if raw_events == self.TRIGGER_EVENTS["unknown"]:
-            _events.append("unknown")
-        # else do a detailed analysis...
-        else:
-            # ... by iterating over every possible kind...
-            for key in self.TRIGGER_EVENTS:
-                # ... and ignoring "unknown" (already handled above)
-                if key == "unknown":
-                    pass
-                elif raw_events & self.TRIGGER_EVENTS[key] == self.TRIGGER_EVENTS[key]:
-                    _events.append(key)
+            return ["unknown"]
+
+        # else visit only the set bits, lowest first
+        _events = []
+        while raw_events:
+            lsb = raw_events & -raw_events
+            raw_events ^= lsb
+            # Bits without a known event are ignored
+            if lsb in self._EVENTS_BY_BIT:
+                _events.append(self._EVENTS_BY_BIT[lsb])
 
         return _events
 
     @property
     def event(self):
         raw_event = libtiepie.DevTrOutGetEvent(self._dev_handle, self._idx)
-        for key in self.TRIGGER_EVENTS:
-            if raw_event == self.TRIGGER_EVENTS[key]:
-                return key
-
-        raise ValueError("Unknown trigger output event: %d" % raw_event)
+        try:
+            return self._TRIGGER_EVENTS_INV[raw_event]
+        except KeyError:
+            raise ValueError(
+                "Unknown trigger output event: %d" % raw_event
+            ) from None
 
     @event.setter
     def event(self, value):
@@ -4,137 +4,248 @@ from handyscope.oscilloscope import Oscilloscope
 from handyscope.generator import Generator
 from handyscope.i2cHost import I2CHost
 import handyscope.deviceList
+from types import SimpleNamespace
 import pytest
 
 
 def pytest_addoption(parser):
     parser.addoption("--product_id", action="store", default="HS5")
+    # Fixed interval in s to poll for completed measurements, by default it
+    # adapts to the measurement duration
+    parser.addoption(
+        "--ready-poll-interval", action="store", type=float, default=None
+    )
+
+
+def pytest_configure(config):
+    Oscilloscope.POLL_INTERVAL = config.getoption("ready_poll_interval")
 
 
 def pytest_generate_tests(metafunc):
     option_value = metafunc.config.option.product_id
     if 'product_id' in metafunc.fixturenames and option_value is not None:
-        metafunc.parametrize("product_id", [option_value], scope="module")
+        metafunc.parametrize("product_id", [option_value], scope="session")
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def dev_list():
     return handyscope.deviceList.device_list
 
 
-@pytest.fixture(scope="module", params=[key for key in DeviceList.DEVICE_TYPES])
+# Session scoped, so pytest groups the tests of all modules by device type
+@pytest.fixture(scope="session",
+                params=[key for key in DeviceList.DEVICE_TYPES])
 def device(product_id, request):
     dev_instance = Device(product_id, "product id", request.param)
     yield dev_instance
     dev_instance.close()
 
 
-@pytest.fixture(scope="module")
+# The devices are opened once and shared by all test modules
+@pytest.fixture(scope="session")
 def osc(product_id):
     osc_instance = Oscilloscope(product_id)
     yield osc_instance
     osc_instance.close()
 
 
+# Channel indices for the channel fixture, covering the up to 8 channels of
+# the supported oscilloscopes. Indices beyond the channel count of the device
+# are skipped
+_CHANNEL_IDXS = range(8)
+
+
+@pytest.fixture(scope="function", params=_CHANNEL_IDXS)
+def channel(osc, request):
+    if request.param >= osc.channel_cnt:
+        pytest.skip("the device has only %d channels" % osc.channel_cnt)
+    return osc.channels[request.param]
+
+
+def _apply_if_changed(obj, attr, value):
+    """Set an attribute only if it differs, to save device round trips."""
+    if getattr(obj, attr) != value:
+        setattr(obj, attr, value)
+
+
 @pytest.fixture(scope="function")
 def default_osc(osc):
     if osc.is_running:
         osc.stop()
-    osc.measure_mode = "block"
-    osc.clock_source = "internal"
-    osc.auto_resolution = "disabled"
-    osc.resolution = 14
-    osc.record_length = 5000
-    osc.segment_cnt = 1
-    osc.trig_delay = 0.0
-    osc.trig_holdoff = 0
-
-    osc.channels[0].is_enabled = True
-    for channel in osc.channels[1:]:
-        channel.is_enabled = False
+    _apply_if_changed(osc, "measure_mode", "block")
+    _apply_if_changed(osc, "clock_source", "internal")
+    _apply_if_changed(osc, "auto_resolution", "disabled")
+    _apply_if_changed(osc, "resolution", 14)
+    _apply_if_changed(osc, "record_length", 5000)
+    _apply_if_changed(osc, "segment_cnt", 1)
+    _apply_if_changed(osc, "trig_delay", 0.0)
+    _apply_if_changed(osc, "trig_holdoff", 0)
+
+    osc.enabled_mask = 0b1
 
     return osc
 
 
-@pytest.fixture(scope="module")
+# Function scoped like the ready_osc* fixtures below, as a module scoped
+# capture would be changed by the tests pytest runs in between
+@pytest.fixture(scope="function")
+def forced_osc(default_osc):
+    for channel in default_osc.channels:
+        _apply_if_changed(channel, "trig_is_enabled", False)
+    _apply_if_changed(default_osc, "trig_timeout", -1)
+
+    default_osc.start()
+    default_osc.force_trig()
+    assert default_osc.wait_for_data_ready(timeout=5.0) is True
+
+    return default_osc
+
+
+# Record length in samples for tests which only check the form of the data
+_SHORT_RECORD_LENGTH = 1000
+# Trigger timeout in seconds, so measurements complete without a trigger
+_SHORT_TRIG_TIMEOUT = 1e-3
+
+
+@pytest.fixture(scope="function")
+def short_osc(default_osc):
+    _apply_if_changed(default_osc, "record_length", _SHORT_RECORD_LENGTH)
+    _apply_if_changed(default_osc, "trig_timeout", _SHORT_TRIG_TIMEOUT)
+
+    return default_osc
+
+
+def _measure(osc):
+    """Start a measurement and wait until it is completed."""
+    osc.start()
+    assert osc.wait_for_data_ready(timeout=5.0) is True
+
+
+# The ready_osc* fixtures provide a completed measurement. They are function
+# scoped, as pytest may run other, measuring tests in between the tests of
+# a parametrized function
+@pytest.fixture(scope="function")
+def ready_osc(short_osc):
+    short_osc.enabled_mask = (1 << short_osc.channel_cnt) - 1
+    _measure(short_osc)
+
+    return short_osc
+
+
+@pytest.fixture(scope="function")
+def ready_osc_without_ch1(short_osc):
+    if short_osc.channel_cnt < 2:
+        pytest.skip("the first channel is the only one")
+    short_osc.enabled_mask = (1 << short_osc.channel_cnt) - 2
+    _measure(short_osc)
+
+    return short_osc
+
+
+@pytest.fixture(scope="session")
 def gen(product_id):
     gen_instance = Generator(product_id)
     yield gen_instance
     gen_instance.close()
 
 
+# Samples loaded by the fixtures for the arbitrary signal type
+_ARB_DATA = [0.0, 1.0, 2.0, 3.0, 4.0]
+
+
+def _set_gen(gen, signal_type, mode="continuous", arb_data=None,
+             **settings):
+    """Configure the generator for a 1 V signal without offset.
+
+    Args:
+        gen: Generator to configure.
+        signal_type: Signal type to set.
+        mode: Generator mode to set.
+        arb_data: Samples to load before the mode is set, if not None.
+        **settings: Further attributes to set after the signal type.
+    """
+    _apply_if_changed(gen, "is_amplitude_autorange", True)
+    _apply_if_changed(gen, "signal_type", signal_type)
+    for attr, value in settings.items():
+        _apply_if_changed(gen, attr, value)
+    if arb_data is not None:
+        gen.arb_data(arb_data)
+    _apply_if_changed(gen, "mode", mode)
+    _apply_if_changed(gen, "offset", 0.0)
+    _apply_if_changed(gen, "amplitude", 1.0)
+
+
 @pytest.fixture(scope="function")
 def default_gen_sine(gen):
-    gen.is_amplitude_autorange = True
-    gen.signal_type = "sine"
-    gen.mode = "continuous"
-    gen.offset = 0.0
-    gen.amplitude = 1.0
+    _set_gen(gen, "sine")
     gen.stop()
 
     return gen
 
 
+@pytest.fixture(scope="module")
+def gen_sine_caps(gen):
+    """Capabilities of the generator in the default_gen_sine setup.
+
+    They do not change while the setup is kept, so they are read only once
+    per test module.
+    """
+    _set_gen(gen, "sine")
+    return SimpleNamespace(
+        signal_types_available=gen.signal_types_available,
+        amplitude_min=gen.amplitude_min,
+        amplitude_max=gen.amplitude_max,
+        amplitude_ranges_available=gen.amplitude_ranges_available,
+        offset_min=gen.offset_min,
+        offset_max=gen.offset_max,
+        freq_min=gen.freq_min,
+        freq_max=gen.freq_max,
+        freq_modes_available=gen.freq_modes_available,
+        phase_min=gen.phase_min,
+        phase_max=gen.phase_max,
+        symmetry_max=gen.symmetry_max,
+        modes_available=gen.modes_available,
+    )
+
+
 @pytest.fixture(scope="function")
 def default_gen_pulse(gen):
-    gen.is_amplitude_autorange = True
-    gen.signal_type = "pulse"
-    gen.mode = "continuous"
-    gen.offset = 0.0
-    gen.amplitude = 1.0
-    gen.freq = 1000.0
+    _set_gen(gen, "pulse", freq=1000.0)
 
     return gen
 
 
 @pytest.fixture(scope="function")
 def default_gen_arb(gen):
-    gen.is_amplitude_autorange = True
-    gen.signal_type = "arbitrary"
-    gen.mode = "continuous"
-    gen.offset = 0.0
-    gen.amplitude = 1.0
+    _set_gen(gen, "arbitrary")
 
     return gen
 
 
 @pytest.fixture(scope="function")
 def default_gen_burst(gen):
-    gen.is_amplitude_autorange = True
-    gen.signal_type = "sine"
-    gen.mode = "burst count"
-    gen.offset = 0.0
-    gen.amplitude = 1.0
+    _set_gen(gen, "sine", mode="burst count")
 
     return gen
 
 
 @pytest.fixture(scope="function")
 def default_gen_burst_sample(gen):
-    gen.is_amplitude_autorange = True
-    gen.signal_type = "arbitrary"
-    gen.freq_mode = "sample"
-    gen.arb_data([0.0, 1.0, 2.0, 3.0, 4.0])
-    gen.mode = "burst sample count"
-    gen.offset = 0.0
-    gen.amplitude = 1.0
+    _set_gen(gen, "arbitrary", mode="burst sample count",
+             arb_data=_ARB_DATA, freq_mode="sample")
 
     return gen
 
 
 @pytest.fixture(scope="function")
 def default_gen_burst_segment(gen):
-    gen.is_amplitude_autorange = True
-    gen.signal_type = "arbitrary"
-    gen.arb_data([0.0, 1.0, 2.0, 3.0, 4.0])
-    gen.mode = "burst segment count"
-    gen.offset = 0.0
-    gen.amplitude = 1.0
+    _set_gen(gen, "arbitrary", mode="burst segment count",
+             arb_data=_ARB_DATA)
 
     return gen
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def i2c(product_id):
     i2c_instance = I2CHost(product_id)
     yield i2c_instance
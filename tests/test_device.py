@@ -84,7 +84,7 @@ def test_trig_in_cnt(device):
 
 
 def test_trig_ins(device):
-    assert len(device.trig_ins) is device.trig_in_cnt
+    assert len(device.trig_ins) == device.trig_in_cnt
     for trig_in in device.trig_ins:
         assert type(trig_in) is TriggerInput
 
@@ -105,7 +105,7 @@ def test_trig_out_cnt(device):
 
 
 def test_trig_outs(device):
-    assert len(device.trig_outs) is device.trig_out_cnt
+    assert len(device.trig_outs) == device.trig_out_cnt
     for trig_out in device.trig_outs:
         assert type(trig_out) is TriggerOutput
 
@@ -1,6 +1,23 @@
+from fractions import Fraction
+import numpy as np
 import pytest
 import math
 
+# Fractions of a setting's range to test its setter with
+RANGE_FRACTIONS = [
+    pytest.param(Fraction(0), id="min"),
+    pytest.param(Fraction(1, 2), id="mid"),
+    pytest.param(Fraction(1), id="max"),
+]
+
+
+def _range_value(low, high, fraction):
+    """Get the value at a fraction of the range from low to high."""
+    value = Fraction(low) + (Fraction(high) - Fraction(low)) * fraction
+    if type(low) is int:
+        return math.ceil(value)
+    return float(value)
+
 
 def test_connector_type(default_gen_sine):
     assert default_gen_sine.connector_type in default_gen_sine.CONNECTOR_TYPES
@@ -38,16 +55,6 @@ def test_status(default_gen_sine):
     assert default_gen_sine.status in default_gen_sine.GENERATOR_STATUSES
 
 
-def test_is_out_on(default_gen_sine):
-    # Test getter
-    assert type(default_gen_sine.is_out_on) is bool
-
-    # Test setter
-    for value in [True, False]:
-        default_gen_sine.is_out_on = value
-        assert default_gen_sine.is_out_on is value
-
-
 def test_is_out_inv_available(default_gen_sine):
     # Test type
     assert type(default_gen_sine.is_out_inv_available) is bool
@@ -55,14 +62,21 @@ def test_is_out_inv_available(default_gen_sine):
     assert default_gen_sine.is_out_inv_available is True
 
 
-def test_is_out_inv(default_gen_sine):
+@pytest.mark.parametrize(
+    "name", ["is_out_on", "is_out_inv", "is_amplitude_autorange"]
+)
+@pytest.mark.parametrize("value", [True, False])
+def test_bool_setting(default_gen_sine, name, value):
     # Test getter
-    assert type(default_gen_sine.is_out_inv) is bool
+    previous = getattr(default_gen_sine, name)
+    assert type(previous) is bool
 
     # Test setter
-    for value in [True, False]:
-        default_gen_sine.is_out_inv = value
-        assert default_gen_sine.is_out_inv is value
+    setattr(default_gen_sine, name, value)
+    assert getattr(default_gen_sine, name) is value
+
+    # The fixture does not reset all of these settings
+    setattr(default_gen_sine, name, previous)
 
 
 def test_start(default_gen_sine):
@@ -80,17 +94,22 @@ def test_is_running(default_gen_sine):
 
 
 def test_signal_types_available(default_gen_sine):
-    assert type(default_gen_sine.signal_types_available) is tuple
-    for sig_type in default_gen_sine.signal_types_available:
+    available = default_gen_sine.signal_types_available
+    assert type(available) is tuple
+    if not available:
+        pytest.skip("no signal types available")
+    for sig_type in available:
         assert sig_type in default_gen_sine.SIGNAL_TYPES
 
 
-def test_signal_type(default_gen_sine):
+def test_signal_type(default_gen_sine, gen_sine_caps):
     # Test getter
     assert default_gen_sine.signal_type in default_gen_sine.SIGNAL_TYPES
 
     # Test setter
-    for sig_type in default_gen_sine.signal_types_available:
+    if not gen_sine_caps.signal_types_available:
+        pytest.skip("no signal types available")
+    for sig_type in gen_sine_caps.signal_types_available:
         default_gen_sine.signal_type = sig_type
         assert default_gen_sine.signal_type == sig_type
 
@@ -105,54 +124,51 @@ def test_amplitude_max(default_gen_sine):
     assert default_gen_sine.amplitude_max > default_gen_sine.amplitude_min
 
 
-def test_amplitude(default_gen_sine):
+@pytest.mark.parametrize("fraction", RANGE_FRACTIONS)
+def test_amplitude(default_gen_sine, gen_sine_caps, fraction):
     # Test getter
     assert type(default_gen_sine.amplitude) is float
 
     # Test setter
-    for ampl in [default_gen_sine.amplitude_min,
-                 (default_gen_sine.amplitude_max-default_gen_sine.amplitude_min)/2,
-                 default_gen_sine.amplitude_max]:
-        default_gen_sine.amplitude = ampl
-        assert default_gen_sine.amplitude == ampl
+    ampl = _range_value(gen_sine_caps.amplitude_min,
+                        gen_sine_caps.amplitude_max, fraction)
+    default_gen_sine.amplitude = ampl
+    assert default_gen_sine.amplitude == pytest.approx(ampl)
 
 
 def test_amplitude_ranges_available(default_gen_sine):
-    assert type(default_gen_sine.amplitude_ranges_available) is tuple
-    for ampl_range in default_gen_sine.amplitude_ranges_available:
+    available = default_gen_sine.amplitude_ranges_available
+    assert type(available) is tuple
+    if not available:
+        pytest.skip("no amplitude ranges available")
+    for ampl_range in available:
         assert type(ampl_range) is float
         assert ampl_range > 0
 
 
-def test_amplitude_range(default_gen_sine):
+def test_amplitude_range(default_gen_sine, gen_sine_caps):
     # Test getter
     assert type(default_gen_sine.amplitude_range) is float
     assert default_gen_sine.amplitude_range > 0
 
     # Test setter
-    for ampl_range in default_gen_sine.amplitude_ranges_available:
+    if not gen_sine_caps.amplitude_ranges_available:
+        pytest.skip("no amplitude ranges available")
+    for ampl_range in gen_sine_caps.amplitude_ranges_available:
         default_gen_sine.amplitude_range = ampl_range
-        assert default_gen_sine.amplitude_range == ampl_range
-
-
-def test_is_amplitude_autorange(default_gen_sine):
-    assert type(default_gen_sine.is_amplitude_autorange) is bool
-
-    for value in [False, True]:
-        default_gen_sine.is_amplitude_autorange = value
-        assert default_gen_sine.is_amplitude_autorange == value
+        assert default_gen_sine.amplitude_range == pytest.approx(ampl_range)
 
 
-def test_verify_amplitude(default_gen_sine):
+def test_verify_amplitude(default_gen_sine, gen_sine_caps):
     # Test type
     assert type(default_gen_sine.verify_amplitude(1)) is float
     # Test verify
-    for ampl in [default_gen_sine.amplitude_min,
-                 (default_gen_sine.amplitude_max-default_gen_sine.amplitude_min)/2,
-                 default_gen_sine.amplitude_max]:
+    for ampl in [gen_sine_caps.amplitude_min,
+                 (gen_sine_caps.amplitude_max-gen_sine_caps.amplitude_min)/2,
+                 gen_sine_caps.amplitude_max]:
         assert default_gen_sine.verify_amplitude(ampl) == ampl
     # Test if amplitude clips
-    assert default_gen_sine.verify_amplitude(default_gen_sine.amplitude_max+1.0) == default_gen_sine.amplitude_max
+    assert default_gen_sine.verify_amplitude(gen_sine_caps.amplitude_max+1.0) == gen_sine_caps.amplitude_max
 
 
 def test_is_offset_available(default_gen_sine):
@@ -170,25 +186,26 @@ def test_offset_max(default_gen_sine):
     assert default_gen_sine.offset_max > 0
 
 
-def test_offset(default_gen_sine):
+@pytest.mark.parametrize("fraction", RANGE_FRACTIONS)
+def test_offset(default_gen_sine, gen_sine_caps, fraction):
     # Test getter
     assert type(default_gen_sine.offset) is float
 
     # Test setter
     # Selectable offset depends on the signal amplitude
-    low_limit = default_gen_sine.offset_min + default_gen_sine.amplitude
-    high_limit = default_gen_sine.offset_max - default_gen_sine.amplitude
-    for value in [low_limit, (high_limit-low_limit)/2, high_limit]:
-        default_gen_sine.offset = value
-        assert default_gen_sine.offset == pytest.approx(value)
+    low_limit = gen_sine_caps.offset_min + default_gen_sine.amplitude
+    high_limit = gen_sine_caps.offset_max - default_gen_sine.amplitude
+    value = _range_value(low_limit, high_limit, fraction)
+    default_gen_sine.offset = value
+    assert default_gen_sine.offset == pytest.approx(value)
 
 
-def test_verify_offset(default_gen_sine):
+def test_verify_offset(default_gen_sine, gen_sine_caps):
     # Test type
-    assert type(default_gen_sine.verify_offset(default_gen_sine.offset_max/2)) is float
+    assert type(default_gen_sine.verify_offset(gen_sine_caps.offset_max/2)) is float
     # Test verify
-    low_limit = default_gen_sine.offset_min + default_gen_sine.amplitude
-    high_limit = default_gen_sine.offset_max - default_gen_sine.amplitude
+    low_limit = gen_sine_caps.offset_min + default_gen_sine.amplitude
+    high_limit = gen_sine_caps.offset_max - default_gen_sine.amplitude
     for offset in [low_limit, (high_limit - low_limit) / 2, high_limit]:
         assert default_gen_sine.verify_offset(offset) == offset
 
@@ -210,42 +227,47 @@ def test_freq_max(default_gen_sine):
     assert default_gen_sine.freq_max > default_gen_sine.freq_min
 
 
-def test_freq(default_gen_sine):
+@pytest.mark.parametrize("fraction", RANGE_FRACTIONS)
+def test_freq(default_gen_sine, gen_sine_caps, fraction):
     # Test getter
     assert type(default_gen_sine.freq) is float
-    assert default_gen_sine.freq >= default_gen_sine.freq_min
-    assert default_gen_sine.freq <= default_gen_sine.freq_max
+    assert default_gen_sine.freq >= gen_sine_caps.freq_min
+    assert default_gen_sine.freq <= gen_sine_caps.freq_max
 
     # Test setter
-    for freq in [default_gen_sine.freq_min,
-                 (default_gen_sine.freq_max-default_gen_sine.freq_min)/2,
-                 default_gen_sine.freq_max]:
-        default_gen_sine.freq = freq
-        assert default_gen_sine.freq == pytest.approx(freq)
+    freq = _range_value(gen_sine_caps.freq_min,
+                        gen_sine_caps.freq_max, fraction)
+    default_gen_sine.freq = freq
+    assert default_gen_sine.freq == pytest.approx(freq)
 
 
-def test_verify_frequency(default_gen_sine):
+def test_verify_frequency(default_gen_sine, gen_sine_caps):
     # Test type
-    assert type(default_gen_sine.verify_frequency(default_gen_sine.freq_max/2)) is float
+    assert type(default_gen_sine.verify_frequency(gen_sine_caps.freq_max/2)) is float
     # Test verify
     assert math.isclose(default_gen_sine.verify_frequency(
-        default_gen_sine.freq_max/2), default_gen_sine.freq_max/2, rel_tol=1e-6)
+        gen_sine_caps.freq_max/2), gen_sine_caps.freq_max/2, rel_tol=1e-6)
     # Test if the frequency clips
-    assert default_gen_sine.verify_frequency(default_gen_sine.freq_max+1.0) == default_gen_sine.freq_max
+    assert default_gen_sine.verify_frequency(gen_sine_caps.freq_max+1.0) == gen_sine_caps.freq_max
 
 
 def test_freq_modes_available(default_gen_sine):
-    assert type(default_gen_sine.freq_modes_available) is tuple
-    for freq_mode in default_gen_sine.freq_modes_available:
+    available = default_gen_sine.freq_modes_available
+    assert type(available) is tuple
+    if not available:
+        pytest.skip("no frequency modes available")
+    for freq_mode in available:
         assert freq_mode in default_gen_sine.FREQUENCY_MODES
 
 
-def test_freq_mode(default_gen_sine):
+def test_freq_mode(default_gen_sine, gen_sine_caps):
     # Test getter
     assert default_gen_sine.freq_mode in default_gen_sine.FREQUENCY_MODES
 
     # Test setter
-    for mode in default_gen_sine.freq_modes_available:
+    if not gen_sine_caps.freq_modes_available:
+        pytest.skip("no frequency modes available")
+    for mode in gen_sine_caps.freq_modes_available:
         default_gen_sine.freq_mode = mode
         assert default_gen_sine.freq_mode == mode
 
@@ -267,31 +289,31 @@ def test_phase_max(default_gen_sine):
     assert default_gen_sine.phase_max <= 360
 
 
-def test_phase(default_gen_sine):
+@pytest.mark.parametrize("fraction", RANGE_FRACTIONS)
+def test_phase(default_gen_sine, gen_sine_caps, fraction):
     # Test getter
     assert type(default_gen_sine.phase) is float
-    assert default_gen_sine.phase >= default_gen_sine.phase_min
-    assert default_gen_sine.phase <= default_gen_sine.phase_max
+    assert default_gen_sine.phase >= gen_sine_caps.phase_min
+    assert default_gen_sine.phase <= gen_sine_caps.phase_max
 
     # Test setter
-    for phase in [default_gen_sine.phase_min,
-                  (default_gen_sine.phase_max-default_gen_sine.phase_min)/2,
-                  default_gen_sine.phase_max]:
-        default_gen_sine.phase = phase
-        assert default_gen_sine.phase == phase
+    phase = _range_value(gen_sine_caps.phase_min,
+                         gen_sine_caps.phase_max, fraction)
+    default_gen_sine.phase = phase
+    assert default_gen_sine.phase == pytest.approx(phase)
 
 
-def test_verify_phase(default_gen_sine):
+def test_verify_phase(default_gen_sine, gen_sine_caps):
     # Test type
-    assert type(default_gen_sine.verify_phase(default_gen_sine.phase_max/2)) is float
+    assert type(default_gen_sine.verify_phase(gen_sine_caps.phase_max/2)) is float
     # Test verify
     assert math.isclose(
-        default_gen_sine.verify_phase(default_gen_sine.phase_max / 2),
-        default_gen_sine.phase_max / 2,
+        default_gen_sine.verify_phase(gen_sine_caps.phase_max / 2),
+        gen_sine_caps.phase_max / 2,
         rel_tol=1e-6)
     # Test if the phase overruns
     assert default_gen_sine.verify_phase(
-        default_gen_sine.phase_max + 1.0) == default_gen_sine.phase_max
+        gen_sine_caps.phase_max + 1.0) == gen_sine_caps.phase_max
 
 
 def test_is_symmetry_available(default_gen_sine):
@@ -312,30 +334,29 @@ def test_symmetry_max(default_gen_sine):
     assert default_gen_sine.symmetry_max > default_gen_sine.symmetry_min
 
 
-def test_symmetry(default_gen_sine):
+@pytest.mark.parametrize("value", [0.0, 0.25, 0.5, 0.75, 1.0])
+def test_symmetry(default_gen_sine, value):
     # Test getter
     assert type(default_gen_sine.symmetry) is float
     assert default_gen_sine.symmetry >= 0
     assert default_gen_sine.symmetry <= 1
 
     # Test setter
-    values = [0.0, 0.25, 0.5, 0.75, 1.0]
-    for value in values:
-        default_gen_sine.symmetry = value
-        assert default_gen_sine.symmetry == value
+    default_gen_sine.symmetry = value
+    assert default_gen_sine.symmetry == pytest.approx(value)
 
 
-def test_verify_symmetry(default_gen_sine):
+def test_verify_symmetry(default_gen_sine, gen_sine_caps):
     # Test type
-    assert type(default_gen_sine.verify_symmetry(default_gen_sine.symmetry_max/2)) is float
+    assert type(default_gen_sine.verify_symmetry(gen_sine_caps.symmetry_max/2)) is float
     # Test verify
     assert math.isclose(default_gen_sine.verify_symmetry(
-        default_gen_sine.symmetry_max / 2),
-        default_gen_sine.symmetry_max / 2,
+        gen_sine_caps.symmetry_max / 2),
+        gen_sine_caps.symmetry_max / 2,
         rel_tol=1e-6)
     # Test if the symmetry clips
     assert default_gen_sine.verify_symmetry(
-        default_gen_sine.symmetry_max + 1.0) == default_gen_sine.symmetry_max
+        gen_sine_caps.symmetry_max + 1.0) == gen_sine_caps.symmetry_max
 
 
 def test_is_pulse_width_available(default_gen_pulse):
@@ -354,7 +375,8 @@ def test_pulse_width_max(default_gen_pulse):
     assert default_gen_pulse.pulse_width_max >= default_gen_pulse.pulse_width_min
 
 
-def test_pulse_width(default_gen_pulse):
+@pytest.mark.parametrize("fraction", RANGE_FRACTIONS)
+def test_pulse_width(default_gen_pulse, fraction):
     # Test getter
     assert type(default_gen_pulse.pulse_width) is float
     assert default_gen_pulse.pulse_width >= 0
@@ -362,12 +384,10 @@ def test_pulse_width(default_gen_pulse):
     assert default_gen_pulse.pulse_width <= default_gen_pulse.pulse_width_max
 
     # Test setter
-    values = [default_gen_pulse.pulse_width_min,
-              (default_gen_pulse.pulse_width_max-default_gen_pulse.pulse_width_min)/2,
-              default_gen_pulse.pulse_width_max]
-    for value in values:
-        default_gen_pulse.pulse_width = value
-        assert default_gen_pulse.pulse_width == pytest.approx(value)
+    value = _range_value(default_gen_pulse.pulse_width_min,
+                         default_gen_pulse.pulse_width_max, fraction)
+    default_gen_pulse.pulse_width = value
+    assert default_gen_pulse.pulse_width == pytest.approx(value)
 
 
 def test_verify_pulse_width(default_gen_pulse):
@@ -421,6 +441,25 @@ def test_arb_data(default_gen_arb):
     default_gen_arb.arb_data([0.0, 1.0, 2.0, 3.0, 4.0])
     assert default_gen_arb.arb_data_length == 5
 
+    # Test with a numpy array
+    default_gen_arb.arb_data(np.linspace(-1, 1, 100))
+    assert default_gen_arb.arb_data_length == 100
+
+    with pytest.raises(ValueError):
+        default_gen_arb.arb_data(np.zeros((2, 5)))
+    with pytest.raises(ValueError):
+        default_gen_arb.arb_data(1.0)
+
+
+@pytest.mark.parametrize("length", [1024, 1 << 20])
+def test_arb_data_large(default_gen_arb, length):
+    if length > default_gen_arb.arb_data_length_max:
+        pytest.skip("arbitrary data buffer is too short")
+    # A float32 array is passed to the library without conversion
+    data = np.sin(np.linspace(0, 2 * np.pi, length, dtype=np.float32))
+    default_gen_arb.arb_data(data)
+    assert default_gen_arb.arb_data_length == length
+
 
 def test_arb_data_raw_type(default_gen_arb):
     assert type(default_gen_arb.arb_raw_type) is str
@@ -458,23 +497,31 @@ def test_arb_data_raw_range(default_gen_arb):
 
 
 def test_modes_native_available(default_gen_sine):
-    assert type(default_gen_sine.modes_native_available) is tuple
-    for mode in default_gen_sine.modes_native_available:
+    available = default_gen_sine.modes_native_available
+    assert type(available) is tuple
+    if not available:
+        pytest.skip("no native modes available")
+    for mode in available:
         assert mode in default_gen_sine.GENERATOR_MODES
 
 
 def test_modes_available(default_gen_sine):
-    assert type(default_gen_sine.modes_available) is tuple
-    for mode in default_gen_sine.modes_available:
+    available = default_gen_sine.modes_available
+    assert type(available) is tuple
+    if not available:
+        pytest.skip("no modes available")
+    for mode in available:
         assert mode in default_gen_sine.GENERATOR_MODES
 
 
-def test_mode(default_gen_sine):
+def test_mode(default_gen_sine, gen_sine_caps):
     # Test getter
     assert default_gen_sine.mode in default_gen_sine.GENERATOR_MODES
 
     # Test setter
-    for mode in default_gen_sine.modes_available:
+    if not gen_sine_caps.modes_available:
+        pytest.skip("no modes available")
+    for mode in gen_sine_caps.modes_available:
         default_gen_sine.mode = mode
         assert default_gen_sine.mode == mode
 
@@ -494,18 +541,18 @@ def test_burst_cnt_max(default_gen_burst):
     assert default_gen_burst.burst_cnt_max > default_gen_burst.burst_cnt_min
 
 
-def test_burst_cnt(default_gen_burst):
+@pytest.mark.parametrize("fraction", RANGE_FRACTIONS)
+def test_burst_cnt(default_gen_burst, fraction):
     # Test getter
     assert type(default_gen_burst.burst_cnt) is int
     assert default_gen_burst.burst_cnt >= default_gen_burst.burst_cnt_min
     assert default_gen_burst.burst_cnt <= default_gen_burst.burst_cnt_max
 
     # Test setter
-    for value in [default_gen_burst.burst_cnt_min,
-                  math.ceil((default_gen_burst.burst_cnt_max - default_gen_burst.burst_cnt_min)/2),
-                  default_gen_burst.burst_cnt_max]:
-        default_gen_burst.burst_cnt = value
-        assert default_gen_burst.burst_cnt == value
+    value = _range_value(default_gen_burst.burst_cnt_min,
+                         default_gen_burst.burst_cnt_max, fraction)
+    default_gen_burst.burst_cnt = value
+    assert default_gen_burst.burst_cnt == value
 
 
 def test_burst_sample_cnt_min(default_gen_burst_sample):
@@ -518,7 +565,8 @@ def test_burst_sample_cnt_max(default_gen_burst_sample):
     assert default_gen_burst_sample.burst_sample_cnt_max > default_gen_burst_sample.burst_sample_cnt_min
 
 
-def test_burst_sample_cnt(default_gen_burst_sample):
+@pytest.mark.parametrize("fraction", RANGE_FRACTIONS)
+def test_burst_sample_cnt(default_gen_burst_sample, fraction):
     # Burst sample count is initially always 0 even though it is not
     # in the range. Setting it to some value sets or clips it accordingly
     default_gen_burst_sample.burst_sample_cnt = 2
@@ -528,12 +576,11 @@ def test_burst_sample_cnt(default_gen_burst_sample):
     assert default_gen_burst_sample.burst_sample_cnt <= default_gen_burst_sample.burst_sample_cnt_max
 
     # Test setter
-    for value in [default_gen_burst_sample.burst_sample_cnt_min,
-                  math.ceil((default_gen_burst_sample.burst_sample_cnt_max -
-                             default_gen_burst_sample.burst_sample_cnt_min) / 2),
-                  default_gen_burst_sample.burst_sample_cnt_max]:
-        default_gen_burst_sample.burst_sample_cnt = value
-        assert default_gen_burst_sample.burst_sample_cnt == value
+    value = _range_value(default_gen_burst_sample.burst_sample_cnt_min,
+                         default_gen_burst_sample.burst_sample_cnt_max,
+                         fraction)
+    default_gen_burst_sample.burst_sample_cnt = value
+    assert default_gen_burst_sample.burst_sample_cnt == value
 
 
 def test_burst_segment_cnt_min(default_gen_burst_segment):
@@ -546,7 +593,8 @@ def test_burst_segment_cnt_max(default_gen_burst_segment):
     assert default_gen_burst_segment.burst_segment_cnt_max > default_gen_burst_segment.burst_segment_cnt_min
 
 
-def test_burst_segment_cnt(default_gen_burst_segment):
+@pytest.mark.parametrize("fraction", RANGE_FRACTIONS)
+def test_burst_segment_cnt(default_gen_burst_segment, fraction):
     # Test getter
     assert type(default_gen_burst_segment.burst_segment_cnt) is int
     # Note: burst_segment_cnt can be read as 0, even if burst_segment_cnt_min is 1
@@ -554,12 +602,11 @@ def test_burst_segment_cnt(default_gen_burst_segment):
     assert default_gen_burst_segment.burst_segment_cnt <= default_gen_burst_segment.burst_segment_cnt_max
 
     # Test setter
-    for value in [default_gen_burst_segment.burst_segment_cnt_min,
-                  math.ceil((default_gen_burst_segment.burst_segment_cnt_max -
-                         default_gen_burst_segment.burst_segment_cnt_min) / 2),
-                  default_gen_burst_segment.burst_segment_cnt_max]:
-        default_gen_burst_segment.burst_segment_cnt = value
-        assert default_gen_burst_segment.burst_segment_cnt == value
+    value = _range_value(default_gen_burst_segment.burst_segment_cnt_min,
+                         default_gen_burst_segment.burst_segment_cnt_max,
+                         fraction)
+    default_gen_burst_segment.burst_segment_cnt = value
+    assert default_gen_burst_segment.burst_segment_cnt == value
 
 
 def test_verify_burst_segment_cnt(default_gen_burst_segment):
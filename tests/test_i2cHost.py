@@ -89,4 +89,4 @@ def test_scan(i2c):
     # Assumption: no devices connected
     addresses = i2c.scan()
     assert type(addresses) is tuple
-    assert len(addresses) is 0
+    assert len(addresses) == 0
@@ -0,0 +1,87 @@
+import handyscope.library as library
+import threading
+
+
+class _FakeFunc:
+    """Library function stub which runs the error check like ctypes."""
+
+    def __init__(self, result):
+        self.result = result
+        self.errcheck = None
+
+    def __call__(self, *args):
+        if self.errcheck is None:
+            return self.result
+        return self.errcheck(self.result, self, args)
+
+
+class _FakeLib:
+    """Library stub whose initialization fails."""
+
+    def __init__(self):
+        self.LibGetLastStatus = _FakeFunc(-1)
+        self.LibGetLastStatusStr = _FakeFunc(b"UNSUCCESSFUL")
+        self.LibInit = _FakeFunc(None)
+        self.LstUpdate = _FakeFunc(None)
+
+
+def test_init():
+    library.init()
+    assert library.is_initialized() is True
+
+
+def test_init_failing_status(monkeypatch):
+    protos = {name: (restype, argtypes)
+              for name, restype, argtypes in library._PROTOS}
+    monkeypatch.setattr(library, "_load_lib", lambda: (_FakeLib(), protos))
+    monkeypatch.setattr(library, "libtiepie", library._LazyLib())
+    monkeypatch.setattr(library, "_LibGetLastStatus", None)
+    monkeypatch.setattr(library, "_init_lock", threading.Lock())
+
+    errors = []
+
+    def init():
+        try:
+            library.init()
+        except OSError as err:
+            errors.append(err)
+
+    # Run in a thread, so a deadlock fails the test instead of hanging it
+    thread = threading.Thread(target=init, daemon=True)
+    thread.start()
+    thread.join(timeout=5.0)
+    assert not thread.is_alive()
+    assert len(errors) == 1
+    assert errors[0].args[0] == "[-1]: UNSUCCESSFUL"
+    assert library.libtiepie._lib is None
+
+
+def test_protos_exported():
+    # Prototypes are only declared on first use, so check all names here to
+    # catch typos early
+    protos = library._PROTOS
+    if library._IS_LINUX:
+        protos += library._PROTOS_LINUX
+    elif library._IS_WINDOWS:
+        protos += library._PROTOS_WIN
+    for name, restype, argtypes in protos:
+        func = getattr(library.libtiepie, name)
+        assert func.restype == restype
+        assert func.argtypes == argtypes
+
+
+def test_protos_unchecked():
+    names = [name for name, restype, argtypes in library._PROTOS]
+    for name in library._PROTOS_UNCHECKED:
+        assert name in names
+        assert getattr(library.libtiepie, name).errcheck is None
+
+
+def test_get_version():
+    version = library.get_version()
+    assert type(version) is str
+    assert len(version.split(".")) == 4
+
+
+def test_version_to_str():
+    assert library.version_to_str(0x0000000900100001) == "0.9.16.1"
@@ -1,9 +1,57 @@
+from handyscope.oscilloscope import _wait_until
 from handyscope.oscilloscopeChannel import OscilloscopeChannel
 import math
+import numpy as np
 import pytest
+import threading
 import time
 
 
+def _wait_data_ready(osc):
+    """Wait until the measurement started on osc is completed."""
+    assert osc.wait_for_data_ready(timeout=5.0) is True
+
+
+def _assert_float_samples(channel_data):
+    """Assert that channel_data is a list of float samples."""
+    assert type(channel_data) is list
+    samples = np.asarray(channel_data)
+    assert samples.ndim == 1
+    assert samples.dtype.kind == "f"
+    # The lists are built from a float array, so the first sample stands for
+    # the element type of all
+    if channel_data:
+        assert type(channel_data[0]) is float
+
+
+def test__wait_until():
+    calls = []
+
+    def predicate():
+        calls.append(None)
+        return len(calls) >= 3
+
+    _wait_until(predicate)
+    assert len(calls) == 3
+
+    end = time.perf_counter() + 0.01
+    _wait_until(lambda: time.perf_counter() >= end, expected_duration=0.01)
+    assert time.perf_counter() >= end
+
+    # A set event ends the wait even if the predicate stays False
+    event = threading.Event()
+    threading.Timer(0.01, event.set).start()
+    assert _wait_until(lambda: False, event=event, timeout=1.0) is True
+    assert event.is_set()
+
+    calls.clear()
+    _wait_until(predicate, poll_interval=1e-3)
+    assert len(calls) == 3
+
+    assert _wait_until(lambda: False, timeout=0.01) is False
+    assert _wait_until(lambda: True, timeout=0.01) is True
+
+
 def test_channel_cnt(osc):
     assert type(osc.channel_cnt) is int
     assert osc.channel_cnt > 0
@@ -11,11 +59,25 @@ def test_channel_cnt(osc):
 
 def test_channels(osc):
     assert type(osc.channels) is tuple
-    assert len(osc.channels) is osc.channel_cnt
+    assert len(osc.channels) == osc.channel_cnt
     for channel in osc.channels:
         assert type(channel) is OscilloscopeChannel
 
 
+def test_enabled_mask(default_osc):
+    # default_osc enables only the first channel
+    assert default_osc.enabled_mask == 1
+
+    all_channels = (1 << default_osc.channel_cnt) - 1
+    default_osc.enabled_mask = all_channels
+    assert default_osc.enabled_mask == all_channels
+    for channel in default_osc.channels:
+        assert channel.is_enabled is True
+
+    with pytest.raises(ValueError):
+        default_osc.enabled_mask = all_channels + 1
+
+
 def test__get_sample_cnts(osc):
     assert len(osc._get_sample_cnts()) == 2
     for element in osc._get_sample_cnts():
@@ -23,243 +85,166 @@ def test__get_sample_cnts(osc):
         assert element >= 0
 
 
-def test_retrieve(osc):
+def test_retrieve(short_osc):
     # Deactivate every channel
-    for channel in osc.channels:
-        channel.is_enabled = False
+    short_osc.enabled_mask = 0
     with pytest.raises(ValueError):
-        osc.retrieve()
+        short_osc.retrieve()
 
     # Incrementally activate channels and call retrieve
-    for idx, channel in enumerate(osc.channels):
+    for idx, channel in enumerate(short_osc.channels):
         channel.is_enabled = True
 
-        osc.start()
-        while not osc.is_data_ready:
-            time.sleep(0.05)
-        data = osc.retrieve()
+        short_osc.start()
+        _wait_data_ready(short_osc)
+        data = short_osc.retrieve()
 
         assert type(data) is list
         assert len(data) == idx + 1
-        for channel_data in data:
+        # The samples of the other channels were checked before already
+        for channel_data in data[:idx]:
             assert type(channel_data) is list
-            for sample in channel_data:
-                assert type(sample) is float
+        _assert_float_samples(data[idx])
 
     # Deactivate all except the last channel
-    for channel in osc.channels[0:-1]:
-        channel.is_enabled = False
-    osc.channels[-1].is_enabled = True
+    short_osc.enabled_mask = 1 << (short_osc.channel_cnt - 1)
 
-    osc.start()
-    while not osc.is_data_ready:
-        time.sleep(0.05)
-    data = osc.retrieve()
+    short_osc.start()
+    _wait_data_ready(short_osc)
+    data = short_osc.retrieve()
 
     assert type(data) is list
-    assert len(data) == osc.channel_cnt
+    assert len(data) == short_osc.channel_cnt
     # Only the last channel should contain actual samples
     for channel_data in data[0:-1]:
         assert channel_data is None
-    assert type(data[-1]) is list
-    for sample in data[-1]:
-        assert type(sample) is float
+    _assert_float_samples(data[-1])
 
     # Test parameter channel_nos: Get deactivated channel -> should raise a ValueError
-    osc.channels[0].is_enabled = False
-    osc.channels[1].is_enabled = True
-    osc.start()
-    while not osc.is_data_ready:
-        time.sleep(0.05)
+    short_osc.enabled_mask = 0b10
+    short_osc.start()
+    _wait_data_ready(short_osc)
     with pytest.raises(ValueError):
-        osc.retrieve(channel_nos=[1])
-
-    # Test parameter channel_nos: Get activated channel -> should work
-    osc.channels[0].is_enabled = False
-    osc.channels[1].is_enabled = True
-    osc.start()
-    while not osc.is_data_ready:
-        time.sleep(0.05)
-    data = osc.retrieve(channel_nos=[2])
+        short_osc.retrieve(channel_nos=[1])
+
+    # Test parameter channel_nos: Get activated channel of the same
+    # measurement -> should work
+    data = short_osc.retrieve(channel_nos=[2])
     assert type(data) is list
-    assert len(data) is 2
+    assert len(data) == 2
     assert data[0] is None
-    assert type(data[1]) is list
-    for sample in data[1]:
-        assert type(sample) is float
+    _assert_float_samples(data[1])
 
 
-def test_retrieve_ch1(osc):
-    # Enable available channels
-    for channel in osc.channels:
-        channel.is_enabled = True
-    osc.start()
-    while not osc.is_data_ready:
-        time.sleep(0.05)
-    data = osc.retrieve_ch1()
-    assert type(data) is list
-    assert len(data) == 1
-    for idx, channel_data in enumerate(data):
-        # Check, if channel is valid
-        if idx < osc.channel_cnt:
-            # Valid channel -> there must be valid data
-            assert type(channel_data) is list
-            for sample in channel_data:
-                assert type(sample) is float
-        else:
-            # Invalid channel -> None
-            assert channel_data is None
+def test_retrieve_as_numpy(ready_osc):
+    data = ready_osc.retrieve(as_numpy=True)
+    assert len(data) == ready_osc.channel_cnt
+    for channel_data in data:
+        assert type(channel_data) is np.ndarray
+        assert channel_data.dtype == np.float32
 
-    # Check for multiple channels
-    if osc.channel_cnt >= 2:
-        # There is more than one channel -> we can disable the first without getting an error
-        osc.channels[0].is_enabled = False
-        osc.start()
-        while not osc.is_data_ready:
-            time.sleep(0.05)
-        data = osc.retrieve_ch1()
-        assert data == [None]
-
-
-def test_retrieve_ch1_to_ch2(osc):
-    # --- Try to retrieve all channels
-    # Enable all available channels
-    for channel in osc.channels:
-        channel.is_enabled = True
-    osc.start()
-    while not osc.is_data_ready:
-        time.sleep(0.05)
-    data = osc.retrieve_ch1_to_ch2()
-    assert type(data) is list
-    assert len(data) == 2
-    for idx, channel_data in enumerate(data):
-        # Check, if channel is valid
-        if idx < osc.channel_cnt:
-            # Valid channel -> there must be valid data
-            assert type(channel_data) is list
-            for sample in channel_data:
-                assert type(sample) is float
-        else:
-            # Invalid channel -> None
-            assert channel_data is None
+    data = ready_osc.retrieve_ch1(as_numpy=True)
+    assert type(data[0]) is np.ndarray
 
-    # --- Try to retrieve all except the first channel
-    # Check for multiple channels
-    if osc.channel_cnt >= 2:
-        # There is more than one channel -> we can disable the first without getting an error
-        osc.channels[0].is_enabled = False
-        osc.start()
-        while not osc.is_data_ready:
-            time.sleep(0.05)
-        data = osc.retrieve_ch1_to_ch2()
-        assert type(data) is list
-        assert len(data) == 2
-        # First channel was disabled
-        assert data[0] is None
-        # Second channel should contain data
-        assert type(data[1]) is list
-        for sample in data[1]:
-            assert type(sample) is float
 
+def test_retrieve_as_array_2d(ready_osc):
+    data = ready_osc.retrieve(as_array_2d=True)
+    assert type(data) is np.ndarray
+    assert data.dtype == np.float32
+    assert data.shape == (
+        ready_osc.channel_cnt, ready_osc._get_sample_cnts()[1]
+    )
 
-def test_retrieve_ch1_to_ch3(osc):
-    # --- Try to retrieve all channels
-    # Enable available channels
-    for channel in osc.channels:
-        channel.is_enabled = True
-    osc.start()
-    while not osc.is_data_ready:
-        time.sleep(0.05)
-    data = osc.retrieve_ch1_to_ch3()
-    assert type(data) is list
-    assert len(data) == 3
-    for idx, channel_data in enumerate(data):
-        # Check, if channel is valid
-        if idx < osc.channel_cnt:
-            # Valid channel -> there must be valid data
-            assert type(channel_data) is list
-            for sample in channel_data:
-                assert type(sample) is float
-        else:
-            # Invalid channel -> None
-            assert channel_data is None
+    data = ready_osc.retrieve(
+        channel_nos=[ready_osc.channel_cnt], as_array_2d=True
+    )
+    assert data.shape[0] == 1
+
+
+def test_retrieve_last_n(ready_osc):
+    data = ready_osc.retrieve(as_numpy=True)
+    last = ready_osc.retrieve_last_n(10, as_numpy=True)
+    assert len(last) == len(data)
+    for channel_last, channel_data in zip(last, data):
+        assert len(channel_last) == 10
+        assert channel_last.tolist() == channel_data[-10:].tolist()
+
+    with pytest.raises(ValueError):
+        ready_osc.retrieve_last_n(-1)
+
+
+def test_retrieve_into(ready_osc):
+    out_arrays = [
+        np.zeros(ready_osc.record_length, dtype=np.float32)
+        for _ in ready_osc.channels
+    ]
+    sample_cnt = ready_osc.retrieve_into(out_arrays)
+    assert type(sample_cnt) is int
+    assert 0 < sample_cnt <= ready_osc.record_length
+
+    # Wrong data type
+    with pytest.raises(ValueError):
+        ready_osc.retrieve_into(
+            [np.zeros(ready_osc.record_length, dtype=np.float64)]
+        )
+    # Too short
+    with pytest.raises(ValueError):
+        ready_osc.retrieve_into([np.zeros(1, dtype=np.float32)])
 
-    # --- Try to retrieve all except the first channel
-    # Check for multiple channels
-    if osc.channel_cnt >= 2:
-        # There is more than one channel -> we can disable the first without getting an error
-        osc.channels[0].is_enabled = False
-        osc.start()
-        while not osc.is_data_ready:
-            time.sleep(0.05)
-        data = osc.retrieve_ch1_to_ch3()
 
+def _retrieve_ch1_to_chn(osc, n):
+    """Call the retrieve_ch1* method retrieving the first n channels."""
+    if n == 1:
+        return osc.retrieve_ch1()
+    return getattr(osc, "retrieve_ch1_to_ch%d" % n)()
+
+
+def test_retrieve_ch1_to_chn(ready_osc):
+    # All retrieve_ch1* methods read the same measurement
+    for n in range(1, 9):
+        data = _retrieve_ch1_to_chn(ready_osc, n)
         assert type(data) is list
-        assert len(data) == 3
-        # First channel was disabled
-        assert data[0] is None
-        # Other channels should contain data, if they are valid ones
-        for idx, channel_data in enumerate(data[1:]):
+        assert len(data) == n
+        for idx, channel_data in enumerate(data):
             # Check, if channel is valid
-            if idx+1 < osc.channel_cnt:
+            if idx < ready_osc.channel_cnt:
                 # Valid channel -> there must be valid data
-                assert type(channel_data) is list
-                for sample in channel_data:
-                    assert type(sample) is float
+                _assert_float_samples(channel_data)
             else:
                 # Invalid channel -> None
                 assert channel_data is None
 
 
-def test_retrieve_ch1_to_ch4(osc):
-    # --- Try to retrieve all channels
-    # Enable available channels
-    for channel in osc.channels:
-        channel.is_enabled = True
-    osc.start()
-    while not osc.is_data_ready:
-        time.sleep(0.05)
-    data = osc.retrieve_ch1_to_ch4()
-    assert type(data) is list
-    assert len(data) == 4
-    for idx, channel_data in enumerate(data):
-        # Check, if channel is valid
-        if idx < osc.channel_cnt:
-            # Valid channel -> there must be valid data
-            assert type(channel_data) is list
-            for sample in channel_data:
-                assert type(sample) is float
-        else:
-            # Invalid channel -> None
-            assert channel_data is None
-
-    # --- Try to retrieve all except the first channel
-    # Check for multiple channels
-    if osc.channel_cnt >= 2:
-        # There is more than one channel -> we can disable the first without getting an error
-        osc.channels[0].is_enabled = False
-        osc.start()
-        while not osc.is_data_ready:
-            time.sleep(0.05)
-        data = osc.retrieve_ch1_to_ch4()
-
+def test_retrieve_ch1_to_chn_without_ch1(ready_osc_without_ch1):
+    for n in range(1, 9):
+        data = _retrieve_ch1_to_chn(ready_osc_without_ch1, n)
         assert type(data) is list
-        assert len(data) == 4
+        assert len(data) == n
         # First channel was disabled
         assert data[0] is None
         # Other channels should contain data, if they are valid ones
-        for idx, channel_data in enumerate(data[1:]):
-            # Check, if channel is valid
-            if idx+1 < osc.channel_cnt:
-                # Valid channel -> there must be valid data
-                assert type(channel_data) is list
-                for sample in channel_data:
-                    assert type(sample) is float
+        for idx, channel_data in enumerate(data[1:], 1):
+            if idx < ready_osc_without_ch1.channel_cnt:
+                _assert_float_samples(channel_data)
             else:
-                # Invalid channel -> None
                 assert channel_data is None
 
 
+def test_wait_for_data_ready(default_osc):
+    # Disable triggers
+    for channel in default_osc.channels:
+        channel.trig_is_enabled = False
+    default_osc.trig_timeout = -1
+
+    default_osc.start()
+    # Without a trigger the measurement does not complete
+    assert default_osc.wait_for_data_ready(timeout=0.01) is False
+
+    default_osc.force_trig()
+    assert default_osc.wait_for_data_ready(timeout=5.0) is True
+    assert default_osc.is_data_ready is True
+
+
 def test_valid_pre_sample_cnt(osc):
     assert type(osc.valid_pre_sample_cnt) is int
     assert osc.valid_pre_sample_cnt >= 0
@@ -283,13 +268,13 @@ def test_force_trig(default_osc):
     default_osc.trig_timeout = -1
 
     assert default_osc.is_force_trig is False
+    assert default_osc.is_triggered is False
 
     # Start measurement and force trigger
     default_osc.start()
     default_osc.force_trig()
 
-    while not default_osc.is_data_ready:
-        time.sleep(0.01)
+    _wait_data_ready(default_osc)
     assert default_osc.is_force_trig is True
 
 
@@ -315,16 +300,8 @@ def test_is_running(default_osc):
     assert default_osc.is_running is True
 
 
-def test_is_triggered(default_osc):
-    assert default_osc.is_triggered is False
-
-    # Start measurement and force trigger
-    default_osc.start()
-    default_osc.force_trig()
-
-    while not default_osc.is_data_ready:
-        time.sleep(0.01)
-    assert default_osc.is_triggered is True
+def test_is_triggered(forced_osc):
+    assert forced_osc.is_triggered is True
 
 
 def test_is_timeout_trig(default_osc):
@@ -333,35 +310,16 @@ def test_is_timeout_trig(default_osc):
 
     default_osc.start()
 
-    while not default_osc.is_data_ready:
-        time.sleep(0.01)
+    _wait_data_ready(default_osc)
     assert default_osc.is_timeout_trig is True
 
 
-def test_is_force_trig(default_osc):
-    # Disable triggers
-    for channel in default_osc.channels:
-        channel.trig_is_enabled = False
-    default_osc.trig_timeout = -1
+def test_is_force_trig(forced_osc):
+    assert forced_osc.is_force_trig is True
 
-    assert default_osc.is_force_trig is False
 
-    # Start measurement and force trigger
-    default_osc.start()
-    default_osc.force_trig()
-
-    while not default_osc.is_data_ready:
-        time.sleep(0.01)
-    assert default_osc.is_force_trig is True
-
-
-def test_is_data_ready(default_osc):
-    assert type(default_osc.is_data_ready) is bool
-
-    default_osc.start()
-    default_osc.force_trig()
-    time.sleep(0.5)
-    assert default_osc.is_data_ready is True
+def test_is_data_ready(forced_osc):
+    assert forced_osc.is_data_ready is True
 
 
 def test_is_data_overflow(default_osc):
@@ -375,7 +333,7 @@ def test_is_data_overflow(default_osc):
     # There should be no overflow in the beginning
     assert default_osc.is_data_overflow is False
     # No readout of data -> buffer should run full after some time
-    time.sleep(1)
+    assert default_osc.wait_for_overflow(timeout=5.0) is True
     assert default_osc.is_data_overflow is True
 
 
@@ -638,8 +596,10 @@ def test_start_connection_test(default_osc):
     if default_osc.is_connection_test_available:
         assert default_osc.start_connection_test() is True
         # Wait until connection test is completed before returning (there is no known way to stop the test)
-        while not default_osc.is_connection_test_completed:
-            time.sleep(0.01)
+        _wait_until(
+            lambda: default_osc.is_connection_test_completed,
+            poll_interval=default_osc.POLL_INTERVAL,
+        )
     else:
         with pytest.raises(OSError) as err:
             default_osc.start_connection_test()
@@ -660,8 +620,10 @@ def test_connection_test_data(default_osc):
         # Start the test
         default_osc.start_connection_test()
         # Wait, until it's finished
-        while not default_osc.is_connection_test_completed:
-            time.sleep(0.01)
+        _wait_until(
+            lambda: default_osc.is_connection_test_completed,
+            poll_interval=default_osc.POLL_INTERVAL,
+        )
 
         # Get the results
         results = default_osc.connection_test_data
@@ -696,9 +658,7 @@ def test_measure(default_osc):
     assert type(data) is list
     # default_osc has only one enabled channel
     assert len(data) == 1
-    assert type(data[0]) is list
-    for sample in data[0]:
-        assert type(sample) is float
+    _assert_float_samples(data[0])
 
     # Check for multiple channels
     if default_osc.channel_cnt >= 2:
@@ -713,9 +673,15 @@ def test_measure(default_osc):
         # First channel was disabled
         assert data[0] is None
         # Second channel should contain data
-        assert type(data[1]) is list
-        for sample in data[1]:
-            assert type(sample) is float
+        _assert_float_samples(data[1])
+
+
+def test_measure_not_started(default_osc, monkeypatch):
+    # A measurement which can not be started must not return stale data
+    monkeypatch.setattr(type(default_osc), "start", lambda self: False)
+    with pytest.raises(OSError) as err:
+        default_osc.measure()
+    assert err.value.args[0] == "Measurement could not be started."
 
 
 def test_time_vector(default_osc):